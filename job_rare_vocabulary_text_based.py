@@ -38,6 +38,9 @@ REMOVE = ''.join(chr(c) for c in list(range(0x0591,0x05BE)) + list(range(0x05BF,
 REMOVE = REMOVE.replace(ETNACHTA, '')
 DIACRITICS_RE = re.compile(f"[{re.escape(REMOVE)}]")
 
+# Unicode directional marks, deleted from each line with str.translate
+DIRECTIONAL_MARKS = str.maketrans('', '', '\u200e\u200f\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069')
+
 def normalize_hebrew_word(word):
     """Normalize Hebrew word for lexical comparison."""
     # Remove most diacritics but keep basic structure
@@ -57,7 +60,7 @@ def parse_hebrew_book(file_path):
         # Process each line
         for line in content.split('\n'):
             # Remove Unicode directional marks
-            clean_line = re.sub(r'[\u200e\u200f\u202a-\u202e\u2066-\u2069]', '', line).strip()
+            clean_line = line.translate(DIRECTIONAL_MARKS).strip()
 
             if not clean_line or 'xxxx' in clean_line:
                 continue
@@ -40,6 +40,9 @@ Generates results/proverbs_analyze_word_ratios_results.txt with:
 import re
 import os
 
+# Unicode directional marks, deleted from each line with str.translate
+DIRECTIONAL_MARKS = str.maketrans('', '', '\u200e\u200f\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069')
+
 def parse_hebrew_proverbs(file_path):
     """Parse Hebrew Proverbs file and extract verses with word counts."""
     verses = {}
@@ -53,7 +56,7 @@ def parse_hebrew_proverbs(file_path):
 
     for line in content.split('\n'):
         # Remove Unicode directional marks and other control characters
-        clean_line = re.sub(r'[\u200e\u200f\u202a-\u202e\u2066-\u2069]', '', line).strip()
+        clean_line = line.translate(DIRECTIONAL_MARKS).strip()
 
         if not clean_line or 'xxxx' in clean_line:
             continue
@@ -133,6 +136,14 @@ def parse_english_proverbs(file_path):
 
     return verses
 
+def format_verse_blocks(verses):
+    """Render numbered report blocks for verses, one string per verse."""
+    return [f"\n{i}. Proverbs {v['verse']}\n"
+            f"   Ratio: {v['ratio']:.3f} ({v['hebrew_count']} Hebrew / {v['english_count']} English)\n"
+            f"   Hebrew: {v['hebrew_text']}\n"
+            f"   English: {v['english_text']}\n"
+            for i, v in enumerate(verses, 1)]
+
 def analyze_word_ratios():
     """Analyze Hebrew to English word count ratios in Proverbs."""
 
@@ -260,21 +271,13 @@ if __name__ == "__main__":
         f.write("TOP 20 VERSES: Fewest Hebrew words relative to English words\n")
         f.write("="*80 + "\n")
 
-        for i, verse_data in enumerate(ratios[:20], 1):
-            f.write(f"\n{i}. Proverbs {verse_data['verse']}\n")
-            f.write(f"   Ratio: {verse_data['ratio']:.3f} ({verse_data['hebrew_count']} Hebrew / {verse_data['english_count']} English)\n")
-            f.write(f"   Hebrew: {verse_data['hebrew_text']}\n")
-            f.write(f"   English: {verse_data['english_text']}\n")
+        f.writelines(format_verse_blocks(ratios[:20]))
 
         f.write("\n" + "="*80 + "\n")
         f.write("TOP 20 VERSES: Most Hebrew words relative to English words\n")
         f.write("="*80 + "\n")
 
-        for i, verse_data in enumerate(ratios[-20:], 1):
-            f.write(f"\n{i}. Proverbs {verse_data['verse']}\n")
-            f.write(f"   Ratio: {verse_data['ratio']:.3f} ({verse_data['hebrew_count']} Hebrew / {verse_data['english_count']} English)\n")
-            f.write(f"   Hebrew: {verse_data['hebrew_text']}\n")
-            f.write(f"   English: {verse_data['english_text']}\n")
+        f.writelines(format_verse_blocks(ratios[-20:]))
 
         f.write(f"\n" + "="*80 + "\n")
         f.write("STATISTICS\n")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Shared per-book lemma index for the ETCBC debug scripts.
+
+Builds book name -> Counter(lemma) for every BHSA book in one pass over the
+corpus (book node -> L.d() -> F.lex.data), together with the corpus-wide
+Counter and the total token count. The result is pickled under ~/.cache,
+keyed by the dataset version and the mtime of lex.tf, so later runs (of any
+debug script) skip loading Text-Fabric altogether. cached() applies the same
+dataset-keyed pickle caching to any other computed value.
+
+It also provides get_app(), a process-wide Text-Fabric app so the dataset is
+loaded at most once per process however many helpers ask for it, and
+get_fabric() for the same over a direct Fabric load of a feature set, and
+search(), which memoizes search results for queries that several steps repeat.
+book_word_ids() reaches a book's words through L.d() from a cached name -> node
+map instead of issuing a 'book book=X << word' search per book, and
+extract_lemma_counts() is the one routine the debug scripts use to count a
+book's lemmas directly from the loaded app. VERBOSE tells the scripts whether
+to print their optional sample output.
+
+Usage:
+    from bhsa_index import build_or_load, get_app
+    book_lemma_counts, all_lemma_counts, total_tokens = build_or_load()
+    A = get_app()
+"""
+
+import os
+import pickle
+import sys
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+BHSA_VERSION = '2021'
+TF_DIR = Path.home() / 'text-fabric-data' / 'github' / 'etcbc' / 'bhsa' / 'tf' / BHSA_VERSION
+LEX_TF_PATH = TF_DIR / 'lex.tf'
+CACHE_DIR = Path.home() / '.cache'
+CACHE_PATH = CACHE_DIR / 'bhsa_lemma_index.pkl'
+
+# Sample listings, A.show() renderings and other extras are printed only when
+# someone is watching the output (or ETCBC_VERBOSE=1)
+VERBOSE = sys.stdout.isatty() or os.environ.get('ETCBC_VERBOSE') == '1'
+
+_APP = None
+_MISSING_FEATURES = set()
+
+def get_app():
+    """Return the BHSA Text-Fabric app, loading it on first call only."""
+    global _APP
+    if _APP is None:
+        from tf.app import use
+        _APP = use('etcbc/bhsa', silent=True)
+    return _APP
+
+@lru_cache(maxsize=None)
+def get_fabric(features):
+    """Return (TF, api) for a silent Fabric load of `features`, once per feature string."""
+    from tf.fabric import Fabric
+    TF = Fabric(locations=[str(TF_DIR)], silent=True)
+    return TF, TF.load(features, silent=True)
+
+def get_feature(A, name):
+    """Return A.api.F.<name>, or None if the dataset lacks it (remembered per process)."""
+    if name in _MISSING_FEATURES:
+        return None
+    feature = getattr(A.api.F, name, None)
+    if feature is None:
+        _MISSING_FEATURES.add(name)
+    return feature
+
+@lru_cache(maxsize=64)
+def search(A, query):
+    """Return A.search(query), running each query at most once per app and process."""
+    return A.search(query)
+
+@lru_cache(maxsize=None)
+def book_nodes(A):
+    """Map each book name to its book node, read straight from the otype index."""
+    book_v = A.api.F.book.v
+    return {book_v(book_id): book_id for book_id in A.api.F.otype.s('book')}
+
+def book_word_ids(A, book_name):
+    """Word nodes of a book via L.d(), with no per-book search to plan and run."""
+    return A.api.L.d(book_nodes(A)[book_name], otype='word')
+
+def extract_lemma_counts(A, book_name, limit=None):
+    """Count the lemmas of a book's first `limit` words (all words if None)."""
+    word_ids = book_word_ids(A, book_name)[:limit]
+
+    # Count raw lex values with map + Counter so the per-word tally runs in C,
+    # then drop empties and strip once per distinct lemma rather than per word
+    raw_counts = Counter(map(A.api.F.lex.data.get, word_ids))
+    lemma_counts = Counter()
+    for lemma, count in raw_counts.items():
+        if lemma and lemma.strip():
+            lemma_counts[lemma.strip()] += count
+    return lemma_counts
+
+def dataset_key():
+    """Identify the dataset a cached index was built from."""
+    try:
+        return (BHSA_VERSION, LEX_TF_PATH.stat().st_mtime_ns)
+    except OSError:
+        return (BHSA_VERSION, None)
+
+def build_index(A):
+    """Count lemmas per book in a single pass over the corpus."""
+    lex_data = A.api.F.lex.data
+
+    # Intern each distinct lemma as a small integer once, so the per-token
+    # counting below hashes ints; strings are only looked up again for the
+    # distinct lemmas of each book. The node -> lemma ID table is a flat list
+    # indexed by node number, so lookups are plain indexing rather than hashing.
+    lemma_strings = []
+    lemma_ids = {}
+    node_lemma_ids = [None] * (max(lex_data) + 1)
+    for node, lemma in lex_data.items():
+        if lemma:
+            lemma_id = lemma_ids.get(lemma)
+            if lemma_id is None:
+                lemma_id = lemma_ids[lemma] = len(lemma_strings)
+                lemma_strings.append(lemma)
+            node_lemma_ids[node] = lemma_id
+
+    book_lemma_counts = {}
+    all_lemma_counts = Counter()
+
+    for book_name, book_id in book_nodes(A).items():
+        if not book_name:
+            continue
+
+        id_counts = Counter(map(node_lemma_ids.__getitem__, A.api.L.d(book_id, otype='word')))
+        id_counts.pop(None, None)  # Words without a lemma
+        counts = Counter({lemma_strings[lemma_id]: count for lemma_id, count in id_counts.items()})
+
+        # BHSA lemmas carry no surrounding whitespace, so instead of stripping every
+        # token, check the distinct keys once and only normalize if that ever changes
+        if any(lemma != lemma.strip() for lemma in counts):
+            stripped = Counter()
+            for lemma, count in counts.items():
+                if lemma.strip():
+                    stripped[lemma.strip()] += count
+            counts = stripped
+
+        book_lemma_counts[book_name] = counts
+        all_lemma_counts.update(counts)
+
+    total_tokens = sum(all_lemma_counts.values())
+    return book_lemma_counts, all_lemma_counts, total_tokens
+
+def outside_counts(book_lemma_counts, all_lemma_counts, book):
+    """
+    Occurrences outside `book` of every lemma that occurs in it, computed as one
+    row (corpus total minus the book's own count) that callers can then reduce.
+    """
+    return {lemma: all_lemma_counts[lemma] - count
+            for lemma, count in book_lemma_counts[book].items()}
+
+def cached(path, compute):
+    """
+    Return the value pickled at `path` if it was built from the current dataset,
+    otherwise call compute() and pickle its result there for the next run.
+    """
+    key = dataset_key()
+
+    if path.exists():
+        try:
+            with open(path, 'rb') as f:
+                cached_key, value = pickle.load(f)
+            if cached_key == key:
+                return value
+        except Exception:
+            pass  # Unreadable or stale cache: recompute below
+
+    value = compute()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump((key, value), f)
+
+    return value
+
+def build_or_load(A=None):
+    """
+    Return (book_lemma_counts, all_lemma_counts, total_tokens), from the pickle
+    cache when it matches the current dataset, otherwise by building the index.
+    A loaded app can be passed in to avoid loading the dataset a second time.
+    """
+    return cached(CACHE_PATH, lambda: build_index(A if A is not None else get_app()))
@@ -9,32 +9,25 @@ from collections import Counter
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+from bhsa_index import book_word_ids, get_app
+
 def test_corpus_size_effect():
     """Test how corpus size affects rare vocabulary detection."""
     print("TESTING CORPUS SIZE EFFECT ON RARE VOCABULARY")
     print("=" * 50)
 
     try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         # Get Job lemmas
         print("Extracting Job lemmas...")
-        job_words = A.search('book book=Iob\n<< word')
-        job_lemmas = []
-
-        for word_tuple in job_words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        job_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
-
-        job_lemma_counts = Counter(job_lemmas)
-        print(f"Job: {len(job_lemmas)} tokens, {len(job_lemma_counts)} unique lemmas")
+        lex_v = A.api.F.lex.v
+        job_lemma_counts = Counter(
+            lemma
+            for word_id in book_word_ids(A, 'Iob')
+            if (lemma := (lex_v(word_id) or '').strip())
+        )
+        print(f"Job: {sum(job_lemma_counts.values())} tokens, {len(job_lemma_counts)} unique lemmas")
 
         # Test different corpus sizes
         test_books = ['Genesis', 'Exodus', 'Leviticus', 'Numeri', 'Deuteronomium']
@@ -42,35 +35,26 @@ def test_corpus_size_effect():
         for num_books in [1, 2, 3, 4, 5]:
             print(f"\nTesting against {num_books} book(s): {test_books[:num_books]}")
 
-            # Collect lemmas from test corpus
+            # Collect lemmas from test corpus (Job itself is kept out, so no subtraction is needed)
             corpus_counts = Counter()
-            corpus_counts.update(job_lemma_counts)  # Include Job
 
             for book in test_books[:num_books]:
                 print(f"  Adding {book}...")
-                words = A.search(f'book book={book}\n<< word')
-
-                for word_tuple in words:
-                    if len(word_tuple) >= 2:
-                        word_id = word_tuple[1]
-                        try:
-                            lemma = A.api.F.lex.v(word_id)
-                            if lemma and lemma.strip():
-                                corpus_counts[lemma.strip()] += 1
-                        except Exception:
-                            pass
+                corpus_counts.update(
+                    lemma
+                    for word_id in book_word_ids(A, book)
+                    if (lemma := (lex_v(word_id) or '').strip())
+                )
 
             # Test different thresholds
-            print(f"  Total corpus size: {len(corpus_counts)} unique lemmas")
+            print(f"  Total corpus size: {len(corpus_counts.keys() | job_lemma_counts.keys())} unique lemmas")
 
             for threshold in [1, 2, 5, 10]:
                 rare_count = 0
                 rare_examples = []
 
-                for lemma in job_lemma_counts:
-                    total_count = corpus_counts[lemma]
-                    job_count = job_lemma_counts[lemma]
-                    outside_job_count = total_count - job_count
+                for lemma, job_count in job_lemma_counts.items():
+                    outside_job_count = corpus_counts[lemma]
 
                     if outside_job_count < threshold:
                         rare_count += 1
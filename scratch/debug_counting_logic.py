@@ -9,32 +9,25 @@ from collections import Counter
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+from bhsa_index import book_nodes, book_word_ids, get_app
+
 def debug_counting_logic():
     """Debug the actual counting logic to find the bug."""
     print("DEBUGGING COUNTING LOGIC")
     print("=" * 40)
 
     try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         # Extract Job lemmas first
         print("1. Extracting Job lemmas...")
-        job_words = A.search('book book=Iob\n<< word')
-        job_lemmas = []
-
-        for word_tuple in job_words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        job_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
-
-        job_lemma_counts = Counter(job_lemmas)
-        print(f"Job lemmas: {len(job_lemmas)} tokens, {len(job_lemma_counts)} unique")
+        lex_v = A.api.F.lex.v
+        job_lemma_counts = Counter(
+            lemma
+            for word_id in book_word_ids(A, 'Iob')
+            if (lemma := (lex_v(word_id) or '').strip())
+        )
+        print(f"Job lemmas: {sum(job_lemma_counts.values())} tokens, {len(job_lemma_counts)} unique")
 
         # Get sample of Job's rarest lemmas (appearing only once in Job)
         job_hapax = [lemma for lemma, count in job_lemma_counts.items() if count == 1]
@@ -45,38 +38,29 @@ def debug_counting_logic():
         print("\n2. Counting these Job hapax in other books...")
 
         # Get all books
-        book_nodes = A.search('book')
-        all_books = []
-        for book_tuple in book_nodes:
-            book_id = book_tuple[0]
-            book_name = A.api.F.book.v(book_id)
-            if book_name and book_name.strip():
-                all_books.append(book_name.strip())
+        all_books = [book_name for book_name in book_nodes(A) if book_name and book_name.strip()]
 
         print(f"Found {len(all_books)} books")
 
         # Count our sample Job hapax in other books
         hapax_in_others = Counter()
+        hapax_set = frozenset(job_hapax[:20])  # Test first 20 Job hapax
 
         for book in all_books:
             if book == 'Iob':
                 continue  # Skip Job itself
 
             print(f"  Checking {book}...")
-            words = A.search(f'book book={book}\n<< word')
-
-            for word_tuple in words:
-                if len(word_tuple) >= 2:
-                    word_id = word_tuple[1]
-                    try:
-                        lemma = A.api.F.lex.v(word_id)
-                        if lemma and lemma.strip():
-                            lemma = lemma.strip()
-                            # Only count if it's one of our Job hapax
-                            if lemma in job_hapax[:20]:  # Test first 20 Job hapax
-                                hapax_in_others[lemma] += 1
-                    except Exception:
-                        pass
+            for word_id in book_word_ids(A, book):
+                try:
+                    lemma = lex_v(word_id)
+                    if lemma and lemma.strip():
+                        lemma = lemma.strip()
+                        # Only count if it's one of our Job hapax
+                        if lemma in hapax_set:
+                            hapax_in_others[lemma] += 1
+                except Exception:
+                    pass
 
         print(f"\n3. Results for first 20 Job hapax legomena:")
         for lemma in job_hapax[:20]:
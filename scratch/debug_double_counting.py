@@ -6,34 +6,35 @@ The fact that Job hapax appear 27+ times elsewhere suggests a major bug.
 
 import os
 from collections import Counter
+from functools import lru_cache
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+from bhsa_index import get_app
+
+@lru_cache(maxsize=None)
+def book_lemmas(A, book_name):
+    """Stripped lemmas of every book<<word search result, computed once per book."""
+    lex_v = A.api.F.lex.v
+    words = A.search(f'book book={book_name}\n<< word')
+    return tuple(
+        lemma
+        for word_tuple in words
+        if len(word_tuple) >= 2 and (lemma := (lex_v(word_tuple[1]) or '').strip())
+    )
+
 def debug_double_counting():
     """Check for double-counting issues."""
     print("DEBUGGING DOUBLE-COUNTING ISSUES")
     print("=" * 40)
 
     try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         # Get one specific Job hapax to trace through the logic
         print("1. Getting a specific Job hapax to trace...")
 
-        job_words = A.search('book book=Iob\n<< word')
-        job_lemmas = []
-        for word_tuple in job_words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        job_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
-
-        job_lemma_counts = Counter(job_lemmas)
+        job_lemma_counts = Counter(book_lemmas(A, 'Iob'))
 
         # Pick a specific hapax to trace
         hapax_to_trace = None
@@ -53,19 +54,8 @@ def debug_double_counting():
             book_id = book_tuple[0]
             book_name = A.api.F.book.v(book_id)
             if book_name and book_name.strip():
-                words = A.search(f'book book={book_name.strip()}\n<< word')
-                book_count = 0
-
-                for word_tuple in words:
-                    if len(word_tuple) >= 2:
-                        word_id = word_tuple[1]
-                        try:
-                            lemma = A.api.F.lex.v(word_id)
-                            if lemma and lemma.strip() == hapax_to_trace:
-                                book_count += 1
-                                all_books_count += 1
-                        except Exception:
-                            pass
+                book_count = book_lemmas(A, book_name.strip()).count(hapax_to_trace)
+                all_books_count += book_count
 
                 if book_count > 0:
                     print(f"  {book_name}: {book_count} occurrences")
@@ -80,19 +70,8 @@ def debug_double_counting():
             book_id = book_tuple[0]
             book_name = A.api.F.book.v(book_id)
             if book_name and book_name.strip() and book_name.strip() != 'Iob':
-                words = A.search(f'book book={book_name.strip()}\n<< word')
-                book_count = 0
-
-                for word_tuple in words:
-                    if len(word_tuple) >= 2:
-                        word_id = word_tuple[1]
-                        try:
-                            lemma = A.api.F.lex.v(word_id)
-                            if lemma and lemma.strip() == hapax_to_trace:
-                                book_count += 1
-                                non_job_count += 1
-                        except Exception:
-                            pass
+                book_count = book_lemmas(A, book_name.strip()).count(hapax_to_trace)
+                non_job_count += book_count
 
                 if book_count > 0:
                     print(f"  {book_name}: {book_count} occurrences")
@@ -103,24 +82,13 @@ def debug_double_counting():
         print(f"\n4. Looking for TRUE corpus hapax legomena...")
 
         # Count all lemmas in entire corpus
-        all_lemmas = []
+        all_lemma_counts = Counter()
         for book_tuple in book_nodes:
             book_id = book_tuple[0]
             book_name = A.api.F.book.v(book_id)
             if book_name and book_name.strip():
-                words = A.search(f'book book={book_name.strip()}\n<< word')
-
-                for word_tuple in words:
-                    if len(word_tuple) >= 2:
-                        word_id = word_tuple[1]
-                        try:
-                            lemma = A.api.F.lex.v(word_id)
-                            if lemma and lemma.strip():
-                                all_lemmas.append(lemma.strip())
-                        except Exception:
-                            pass
-
-        all_lemma_counts = Counter(all_lemmas)
+                all_lemma_counts.update(book_lemmas(A, book_name.strip()))
+
         true_hapax = [lemma for lemma, count in all_lemma_counts.items() if count == 1]
 
         print(f"TRUE hapax in entire Hebrew Bible: {len(true_hapax)}")
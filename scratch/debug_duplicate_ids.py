@@ -6,14 +6,20 @@ Check if search queries are returning duplicate word IDs
 import os
 import sys
 from collections import Counter
+from itertools import groupby
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
+from bhsa_index import get_app
+
+def count_ids(word_ids):
+    """Sort the IDs once and return (word_id, occurrences) runs in ID order."""
+    return [(wid, sum(1 for _ in run)) for wid, run in groupby(sorted(word_ids))]
+
 def main():
     print("Loading ETCBC dataset...")
-    from tf.app import use
-    A = use('etcbc/bhsa', silent=True)
+    A = get_app()
 
     print("\n" + "="*70)
     print("CHECKING FOR DUPLICATE WORD IDs IN SEARCH RESULTS")
@@ -32,12 +38,12 @@ def main():
             word_ids.append(word_id)
 
     print(f"Total word IDs extracted: {len(word_ids)}")
-    print(f"Unique word IDs: {len(set(word_ids))}")
+    id_counts = count_ids(word_ids)
+    print(f"Unique word IDs: {len(id_counts)}")
 
-    if len(word_ids) != len(set(word_ids)):
+    if len(word_ids) != len(id_counts):
         print("\n*** DUPLICATES DETECTED! ***")
-        id_counts = Counter(word_ids)
-        duplicates = [(wid, count) for wid, count in id_counts.items() if count > 1]
+        duplicates = [(wid, count) for wid, count in id_counts if count > 1]
         print(f"Number of word IDs appearing multiple times: {len(duplicates)}")
 
         print("\nFirst 10 duplicate IDs:")
@@ -69,12 +75,12 @@ def main():
             word_ids.append(word_id)
 
     print(f"Total word IDs extracted: {len(word_ids)}")
-    print(f"Unique word IDs: {len(set(word_ids))}")
+    id_counts = count_ids(word_ids)
+    print(f"Unique word IDs: {len(id_counts)}")
 
-    if len(word_ids) != len(set(word_ids)):
+    if len(word_ids) != len(id_counts):
         print("\n*** DUPLICATES DETECTED IN JOB! ***")
-        id_counts = Counter(word_ids)
-        duplicates = [(wid, count) for wid, count in id_counts.items() if count > 1]
+        duplicates = [(wid, count) for wid, count in id_counts if count > 1]
         print(f"Number of word IDs appearing multiple times: {len(duplicates)}")
     else:
         print("\nNo duplicates in Job - search results are clean")
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Debug Text-Fabric features"""
 
-from tf.app import use
+from bhsa_index import get_app
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 # Get a few words and test all features
 words = A.search('word')
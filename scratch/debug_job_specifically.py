@@ -4,10 +4,10 @@
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from tf.app import use
+from bhsa_index import get_app
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 if A:
     print("Dataset loaded")
@@ -4,10 +4,10 @@
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from tf.app import use
+from bhsa_index import get_app
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 if A:
     print("Dataset loaded")
@@ -21,15 +21,13 @@ if A:
             print(f"Found Job book: '{book_name}'")
 
             # Get words from Job
-            words = A.search(f'book book={book_name}\n<< word')
+            words = A.api.L.d(book_id, otype='word')
             print(f"Words in {book_name}: {len(words)}")
 
             if words:
                 print("Testing feature access on first few words:")
 
-                for i, word_tuple in enumerate(words[:10]):
-                    word_id = word_tuple[0] if isinstance(word_tuple, tuple) else word_tuple
-
+                for i, word_id in enumerate(words[:10]):
                     # Test different lemma features
                     features_to_test = ['lex', 'g_lex', 'lex_utf8', 'g_lex_utf8']
 
@@ -5,29 +5,20 @@ Inspect individual lemmas to understand the counting issue
 
 import os
 import sys
-from collections import Counter
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
+from bhsa_index import build_or_load
+
 def main():
-    print("Loading ETCBC dataset...")
-    from tf.app import use
-    A = use('etcbc/bhsa', silent=True)
+    print("Loading per-book lemma index...")
+    book_lemma_counts, _, _ = build_or_load()
 
     # Extract Job lemmas
     print("\nExtracting Job lemmas...")
-    job_words = A.search('book book=Iob\n<< word')
-    job_lemmas = []
-    for word_tuple in job_words:
-        if len(word_tuple) >= 2:
-            word_id = word_tuple[1]
-            lemma = A.api.F.lex.v(word_id)
-            if lemma and lemma.strip():
-                job_lemmas.append(lemma.strip())
-
-    job_lemma_counts = Counter(job_lemmas)
-    print(f"Job has {len(job_lemmas)} tokens, {len(job_lemma_counts)} unique lemmas")
+    job_lemma_counts = book_lemma_counts['Iob']
+    print(f"Job has {sum(job_lemma_counts.values())} tokens, {len(job_lemma_counts)} unique lemmas")
 
     # Pick some Job lemmas that appear rarely
     rare_in_job = [(lemma, count) for lemma, count in job_lemma_counts.items() if count <= 3]
@@ -48,28 +39,9 @@ def main():
         print(f"  Count in Job: 1")
 
         # Count in all books
-        total_count = 0
-        book_details = []
-
-        book_nodes = A.search('book')
-        for book_tuple in book_nodes:
-            book_id = book_tuple[0] if isinstance(book_tuple, tuple) else book_tuple
-            book_name = A.api.F.book.v(book_id)
-
-            if book_name:
-                # Count this lemma in this book
-                words = A.search(f'book book={book_name}\n<< word')
-                book_count = 0
-                for word_tuple in words:
-                    if len(word_tuple) >= 2:
-                        word_id = word_tuple[1]
-                        word_lemma = A.api.F.lex.v(word_id)
-                        if word_lemma == lemma:
-                            book_count += 1
-
-                if book_count > 0:
-                    book_details.append((book_name, book_count))
-                    total_count += book_count
+        book_details = [(book_name, lemma_counts[lemma])
+                        for book_name, lemma_counts in book_lemma_counts.items() if lemma in lemma_counts]
+        total_count = sum(count for _, count in book_details)
 
         print(f"  Total count in entire Bible: {total_count}")
         print(f"  Count outside Job: {total_count - 1}")
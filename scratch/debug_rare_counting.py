@@ -3,6 +3,7 @@
 Debug script to understand why we're getting 0 rare Job lemmas
 """
 
+import heapq
 import os
 import sys
 from collections import Counter
@@ -10,34 +11,20 @@ from collections import Counter
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
+from bhsa_index import build_or_load
+
 def main():
-    print("Loading ETCBC dataset...")
-    from tf.app import use
-    A = use('etcbc/bhsa', silent=True)
+    print("Loading per-book lemma index...")
+    book_lemma_counts, all_lemma_counts, _ = build_or_load()
 
     # Extract Job lemmas
     print("\nExtracting Job lemmas...")
-    job_words = A.search('book book=Iob\n<< word')
-    job_lemmas = []
-    for word_tuple in job_words:
-        if len(word_tuple) >= 2:
-            word_id = word_tuple[1]
-            lemma = A.api.F.lex.v(word_id)
-            if lemma and lemma.strip():
-                job_lemmas.append(lemma.strip())
-
-    job_lemma_counts = Counter(job_lemmas)
-    print(f"Job has {len(job_lemmas)} tokens, {len(job_lemma_counts)} unique lemmas")
+    job_lemma_counts = book_lemma_counts['Iob']
+    print(f"Job has {sum(job_lemma_counts.values())} tokens, {len(job_lemma_counts)} unique lemmas")
 
     # Get all books except Job
     print("\nGetting all books...")
-    book_nodes = A.search('book')
-    all_books = []
-    for book_tuple in book_nodes:
-        book_id = book_tuple[0] if isinstance(book_tuple, tuple) else book_tuple
-        book_name = A.api.F.book.v(book_id)
-        if book_name and book_name.strip() and book_name != 'Iob':
-            all_books.append(book_name.strip())
+    all_books = [book for book in book_lemma_counts if book != 'Iob']
 
     print(f"Found {len(all_books)} books (excluding Job)")
 
@@ -47,18 +34,9 @@ def main():
 
     for i, book in enumerate(all_books, 1):
         print(f"Processing {book} ({i}/{len(all_books)})...", end=' ')
-        words = A.search(f'book book={book}\n<< word')
-        lemmas = []
-        for word_tuple in words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                lemma = A.api.F.lex.v(word_id)
-                if lemma and lemma.strip():
-                    lemmas.append(lemma.strip())
-
-        for lemma in lemmas:
-            non_job_lemma_counts[lemma] += 1
-        print(f"{len(lemmas)} tokens")
+        lemma_counts = book_lemma_counts[book]
+        non_job_lemma_counts.update(lemma_counts)
+        print(f"{sum(lemma_counts.values())} tokens")
 
     print(f"\nTotal unique lemmas in non-Job books: {len(non_job_lemma_counts)}")
 
@@ -75,8 +53,8 @@ def main():
 
     # Show some examples
     print("\nFirst 20 rare Job lemmas:")
-    rare_lemmas.sort(key=lambda x: x[2])  # Sort by outside count
-    for i, (lemma, job_count, outside_count) in enumerate(rare_lemmas[:20], 1):
+    lowest_outside = heapq.nsmallest(20, rare_lemmas, key=lambda x: x[2])  # By outside count
+    for i, (lemma, job_count, outside_count) in enumerate(lowest_outside, 1):
         print(f"{i:2d}. {lemma:<30} Job: {job_count:3d}, Elsewhere: {outside_count}")
 
     # Check hapax legomena in entire corpus
@@ -84,16 +62,7 @@ def main():
     print("CORPUS-WIDE HAPAX CHECK:")
     print("="*60)
 
-    all_lemma_counts = Counter(job_lemmas)
-    for book in all_books:
-        words = A.search(f'book book={book}\n<< word')
-        for word_tuple in words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                lemma = A.api.F.lex.v(word_id)
-                if lemma and lemma.strip():
-                    all_lemma_counts[lemma.strip()] += 1
-
+    # The index already holds one corpus-wide Counter (Job included), built in the same pass
     hapax = [lemma for lemma, count in all_lemma_counts.items() if count == 1]
     print(f"Total hapax legomena (appearing exactly once in entire corpus): {len(hapax)}")
 
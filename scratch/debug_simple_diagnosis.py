@@ -10,10 +10,11 @@ from collections import Counter
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
+from bhsa_index import build_or_load, get_app
+
 def main():
     print("Loading ETCBC dataset...")
-    from tf.app import use
-    A = use('etcbc/bhsa', silent=True)
+    A = get_app()
 
     # Get a few sample verses from Job and show all lemma data
     print("\nExamining first verse of Job in detail...")
@@ -58,23 +59,13 @@ def main():
     print("JOB LEMMA FREQUENCY DISTRIBUTION:")
     print("="*70)
 
-    job_words = A.search('book book=Iob\n<< word')
-    job_lemmas = []
-    for word_tuple in job_words:
-        if len(word_tuple) >= 2:
-            word_id = word_tuple[1]
-            lemma = A.api.F.lex.v(word_id)
-            if lemma and lemma.strip():
-                job_lemmas.append(lemma.strip())
-
-    job_lemma_counts = Counter(job_lemmas)
-    print(f"\nTotal tokens in Job: {len(job_lemmas)}")
+    book_lemma_counts, _, _ = build_or_load(A)
+    job_lemma_counts = book_lemma_counts['Iob']
+    print(f"\nTotal tokens in Job: {sum(job_lemma_counts.values())}")
     print(f"Unique lemmas in Job: {len(job_lemma_counts)}")
 
     # Show distribution
-    freq_dist = Counter()
-    for lemma, count in job_lemma_counts.items():
-        freq_dist[count] += 1
+    freq_dist = Counter(job_lemma_counts.values())
 
     print("\nFrequency distribution (how many lemmas appear N times):")
     for freq in sorted(freq_dist.keys())[:20]:
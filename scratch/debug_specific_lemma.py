@@ -10,10 +10,11 @@ from collections import Counter
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
+from bhsa_index import build_or_load, outside_counts
+
 def main():
-    print("Loading ETCBC dataset...")
-    from tf.app import use
-    A = use('etcbc/bhsa', silent=True)
+    print("Loading per-book lemma index...")
+    book_lemma_counts, _, _ = build_or_load()
 
     test_lemma = "MLJYH/"
 
@@ -22,26 +23,13 @@ def main():
     print(f"{'='*70}")
 
     # Count in each book
-    book_nodes = A.search('book')
-    all_books = []
-    for book_tuple in book_nodes:
-        book_id = book_tuple[0] if isinstance(book_tuple, tuple) else book_tuple
-        book_name = A.api.F.book.v(book_id)
-        if book_name and book_name.strip():
-            all_books.append(book_name.strip())
+    all_books = list(book_lemma_counts)
 
     total_count = 0
     books_with_lemma = []
 
     for book in all_books:
-        words = A.search(f'book book={book}\n<< word')
-        count = 0
-        for word_tuple in words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                lemma = A.api.F.lex.v(word_id)
-                if lemma == test_lemma:
-                    count += 1
+        count = book_lemma_counts[book][test_lemma]
 
         if count > 0:
             books_with_lemma.append((book, count))
@@ -64,28 +52,18 @@ def main():
 
     # Replicate main script counting
     all_lemma_counts = Counter()
-    job_lemmas = []
+    job_lemma_counts = Counter()
 
     for book in all_books:
         print(f"Processing {book}...", end=' ')
-        words = A.search(f'book book={book}\n<< word')
-        lemmas = []
-        for word_tuple in words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                lemma = A.api.F.lex.v(word_id)
-                if lemma and lemma.strip():
-                    lemmas.append(lemma.strip())
+        lemma_counts = book_lemma_counts[book]
 
         if book == 'Iob':
-            job_lemmas = lemmas
-
-        for lemma in lemmas:
-            all_lemma_counts[lemma] += 1
+            job_lemma_counts = lemma_counts
 
-        print(f"{len(lemmas)} tokens")
+        all_lemma_counts.update(lemma_counts)
 
-    job_lemma_counts = Counter(job_lemmas)
+        print(f"{sum(lemma_counts.values())} tokens")
 
     print(f"\nFor lemma '{test_lemma}':")
     print(f"  all_lemma_counts['{test_lemma}']: {all_lemma_counts[test_lemma]}")
@@ -104,11 +82,8 @@ def main():
     print("FULL ANALYSIS:")
     print(f"{'='*70}")
 
-    rare_count = 0
-    for lemma in job_lemma_counts:
-        outside_count = all_lemma_counts[lemma] - job_lemma_counts[lemma]
-        if outside_count < 5:
-            rare_count += 1
+    outside_job_counts = outside_counts(book_lemma_counts, all_lemma_counts, 'Iob')
+    rare_count = sum(1 for outside_count in outside_job_counts.values() if outside_count < 5)
 
     print(f"Total Job lemmas: {len(job_lemma_counts)}")
     print(f"Rare Job lemmas (appearing <5 times outside): {rare_count}")
@@ -118,17 +93,14 @@ def main():
         print("This means EVERY Job lemma appears 5+ times outside Job.")
         print("Let me check the minimum outside count...")
 
-        min_outside = float('inf')
-        min_lemma = None
-        for lemma in job_lemma_counts:
-            outside_count = all_lemma_counts[lemma] - job_lemma_counts[lemma]
-            if outside_count < min_outside:
-                min_outside = outside_count
-                min_lemma = lemma
-
-        print(f"\nRarest Job lemma: '{min_lemma}'")
-        print(f"  Appears {job_lemma_counts[min_lemma]} times in Job")
-        print(f"  Appears {min_outside} times outside Job")
+        if outside_job_counts:
+            min_lemma, min_outside = min(outside_job_counts.items(), key=lambda item: item[1])
+
+            print(f"\nRarest Job lemma: '{min_lemma}'")
+            print(f"  Appears {job_lemma_counts[min_lemma]} times in Job")
+            print(f"  Appears {min_outside} times outside Job")
+        else:
+            print("\nNo Job lemmas found, so there is no minimum to report")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
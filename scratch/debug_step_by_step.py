@@ -5,7 +5,11 @@ Following AGENTS.md guidance: break down into small pieces and test each step
 """
 
 import os
+from bisect import bisect_left
 from collections import Counter
+from itertools import islice
+
+from bhsa_index import VERBOSE, CACHE_DIR, book_word_ids, build_or_load, cached, extract_lemma_counts, get_app, search
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
@@ -15,8 +19,7 @@ def step1_basic_connection():
     print("-" * 40)
 
     try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         if A and hasattr(A, 'api'):
             print("SUCCESS: ETCBC connection successful")
@@ -34,24 +37,20 @@ def step2_job_lemma_extraction(A):
     print("-" * 40)
 
     try:
-        # Get Job words
-        job_words = A.search('book book=Iob\n<< word')
+        # Get Job words (each result is a (book, word) pair)
+        job_words = search(A, 'book book=Iob\n<< word')
         print(f"Found {len(job_words)} word tokens in Job")
 
-        # Test extraction on small sample first
-        sample_lemmas = []
-        for i, word_tuple in enumerate(job_words[:100]):
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        sample_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
+        # Test extraction on small sample first, reading the raw lex feature
+        # dict directly instead of calling F.lex.v() per word
+        lex_data = A.api.F.lex.data
+        word_ids = [word_id for _book, word_id in islice(job_words, 100)]
+        sample_lemmas = [lemma.strip() for word_id in word_ids
+                         if (lemma := lex_data.get(word_id)) and lemma.strip()]
 
         print(f"SUCCESS: Extracted {len(sample_lemmas)} lemmas from first 100 words")
-        print(f"Sample lemmas: {sample_lemmas[:10]}")
+        if VERBOSE:
+            print(f"Sample lemmas: {sample_lemmas[:10]}")
 
         if len(sample_lemmas) > 0:
             return True
@@ -69,24 +68,14 @@ def step3_full_job_extraction(A):
     print("-" * 40)
 
     try:
-        job_words = A.search('book book=Iob\n<< word')
-        job_lemmas = []
-
         print("Extracting all Job lemmas...")
-        for word_tuple in job_words:
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        job_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
-
-        job_lemma_counts = Counter(job_lemmas)
-        print(f"SUCCESS: Total Job lemmas: {len(job_lemmas)}")
+        # Job's row of the shared per-book index (pickle-cached per dataset)
+        book_lemma_counts, _, _ = build_or_load(A)
+        job_lemma_counts = book_lemma_counts['Iob']
+        print(f"SUCCESS: Total Job lemmas: {sum(job_lemma_counts.values())}")
         print(f"SUCCESS: Unique Job lemmas: {len(job_lemma_counts)}")
-        print(f"Most common Job lemmas: {job_lemma_counts.most_common(5)}")
+        if VERBOSE:
+            print(f"Most common Job lemmas: {job_lemma_counts.most_common(5)}")
 
         return job_lemma_counts
 
@@ -100,23 +89,12 @@ def step4_test_other_book(A, book_name="Genesis"):
     print("-" * 40)
 
     try:
-        book_words = A.search(f'book book={book_name}\n<< word')
-        print(f"Found {len(book_words)} words in {book_name}")
+        print(f"Found {len(book_word_ids(A, book_name))} words in {book_name}")
 
         # Extract sample
-        book_lemmas = []
-        for word_tuple in book_words[:1000]:  # Sample
-            if len(word_tuple) >= 2:
-                word_id = word_tuple[1]
-                try:
-                    lemma = A.api.F.lex.v(word_id)
-                    if lemma and lemma.strip():
-                        book_lemmas.append(lemma.strip())
-                except Exception:
-                    pass
-
-        book_lemma_counts = Counter(book_lemmas)
-        print(f"SUCCESS: Extracted {len(book_lemmas)} lemmas from {book_name} sample")
+        book_lemma_counts = cached(CACHE_DIR / f'bhsa_step4_{book_name}_sample_lemma_counts.pkl',
+                                   lambda: extract_lemma_counts(A, book_name, limit=1000))
+        print(f"SUCCESS: Extracted {sum(book_lemma_counts.values())} lemmas from {book_name} sample")
         print(f"SUCCESS: Unique lemmas: {len(book_lemma_counts)}")
 
         return book_lemma_counts
@@ -125,6 +103,25 @@ def step4_test_other_book(A, book_name="Genesis"):
         print(f"FAILED: {book_name} extraction error: {e}")
         return None
 
+def step4b_all_books(A):
+    """Step 4b: Lemma counts for every book, from the shared index"""
+    print("\nSTEP 4b: Extracting all books")
+    print("-" * 40)
+
+    try:
+        # One pass over the corpus (pickle-cached) rather than a search per book
+        book_lemma_counts, all_lemma_counts, total_tokens = build_or_load(A)
+
+        largest = max(book_lemma_counts, key=lambda book: sum(book_lemma_counts[book].values()))
+        print(f"SUCCESS: {len(book_lemma_counts)} books, {total_tokens} lemma tokens")
+        print(f"Largest book: {largest} ({sum(book_lemma_counts[largest].values())} lemmas)")
+
+        return book_lemma_counts
+
+    except Exception as e:
+        print(f"FAILED: All-books extraction error: {e}")
+        return None
+
 def step5_test_rare_logic(job_counts, other_counts):
     """Step 5: Test rare vocabulary logic with samples"""
     print("\nSTEP 5: Testing rare vocabulary logic")
@@ -144,19 +141,17 @@ def step5_test_rare_logic(job_counts, other_counts):
     # Test different thresholds
     thresholds = [1, 2, 5, 10]
 
-    for threshold in thresholds:
-        rare_count = 0
-        rare_examples = []
-
-        for lemma in job_counts:
-            total_count = all_counts[lemma]
-            job_count = job_counts[lemma]
-            outside_job_count = total_count - job_count
+    # Compute each lemma's outside-Job count once; every threshold then counts
+    # with a bisect over the sorted counts and only scans rows for its examples
+    rows = [(lemma, job_count, all_counts[lemma] - job_count)
+            for lemma, job_count in job_counts.items()]
+    sorted_outside = sorted(outside for _, _, outside in rows)
 
-            if outside_job_count < threshold:
-                rare_count += 1
-                if len(rare_examples) < 3:
-                    rare_examples.append(f"{lemma} (Job:{job_count}, Outside:{outside_job_count})")
+    for threshold in thresholds:
+        rare_count = bisect_left(sorted_outside, threshold)
+        rare_examples = [f"{lemma} (Job:{job_count}, Outside:{outside_job_count})"
+                         for lemma, job_count, outside_job_count in rows
+                         if outside_job_count < threshold][:3] if VERBOSE else []
 
         print(f"Threshold <{threshold}: {rare_count} rare lemmas")
         if rare_examples:
@@ -192,6 +187,11 @@ def run_step_by_step_debug():
         print("\nFAILED: Cannot extract other book lemmas")
         return
 
+    # Step 4b: Every book
+    if not step4b_all_books(A):
+        print("\nFAILED: Cannot extract lemmas for all books")
+        return
+
     # Step 5: Logic test
     if not step5_test_rare_logic(job_counts, other_counts):
         print("\nFAILED: Rare vocabulary logic broken")
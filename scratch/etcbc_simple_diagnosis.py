@@ -80,16 +80,12 @@ def test_direct_fabric_loading():
     print("-" * 40)
 
     try:
-        from tf.fabric import Fabric
-
-        home = Path.home()
-        tf_path = str(home / 'text-fabric-data' / 'github' / 'etcbc' / 'bhsa' / 'tf' / '2021')
+        from bhsa_index import TF_DIR, get_fabric
 
-        print(f"Loading from: {tf_path}")
+        print(f"Loading from: {TF_DIR}")
 
         # Try with minimal features and silent mode
-        TF = Fabric(locations=[tf_path], silent=True)
-        api = TF.load('book lex', silent=True)
+        TF, api = get_fabric('book')
 
         if api:
             print("Fabric loading: SUCCESS")
@@ -97,14 +93,13 @@ def test_direct_fabric_loading():
 
             # Test node access
             try:
-                all_nodes = list(TF.nodes())
-                print(f"Total nodes: {len(all_nodes)}")
+                # Count without materializing the ~1.4M node and word lists
+                print(f"Total nodes: {sum(1 for _ in TF.nodes())}")
 
-                # Test search
-                books = list(TF.search('book'))
-                words = list(TF.search('word'))
+                # Book and word nodes from the otype index
+                books = api.F.otype.s('book')
                 print(f"Books found: {len(books)}")
-                print(f"Words found: {len(words)}")
+                print(f"Words found: {len(api.F.otype.s('word'))}")
 
                 # Test feature access on a book
                 if books:
@@ -140,10 +135,10 @@ def test_app_loading():
         # Set environment for UTF-8
         os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-        from tf.app import use
+        from bhsa_index import get_app, search
 
         # Try with silent mode to avoid Unicode console issues
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         if A and hasattr(A, 'api'):
             print("App loading: SUCCESS")
@@ -151,7 +146,7 @@ def test_app_loading():
 
             # Test search
             try:
-                books = A.search('book')
+                books = search(A, 'book')
                 print(f"Books found via app: {len(books)}")
 
                 if books:
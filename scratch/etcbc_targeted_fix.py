@@ -11,7 +11,6 @@ This suggests a node ID or API access pattern issue.
 """
 
 import os
-from pathlib import Path
 
 def test_node_id_formats():
     """Test different ways to access node data"""
@@ -19,19 +18,21 @@ def test_node_id_formats():
     print("-" * 40)
 
     try:
-        from tf.app import use
+        from bhsa_index import get_app, search
 
         # Load with silent mode
-        A = use('etcbc/bhsa', silent=True)
+        A = get_app()
 
         if A and hasattr(A, 'api'):
             print("App loaded successfully")
 
             # Get books
-            books = A.search('book')
+            books = search(A, 'book')
             print(f"Found {len(books)} books")
 
             if books:
+                book_v = A.api.F.book.v
+
                 # Test different node access patterns
                 first_book = books[0]
                 print(f"First book node: {first_book} (type: {type(first_book)})")
@@ -43,14 +44,14 @@ def test_node_id_formats():
                     print(f"Node ID: {node_id}")
 
                     try:
-                        book_name = A.api.F.book.v(node_id)
+                        book_name = book_v(node_id)
                         print(f"Book name (ID): '{book_name}'")
                     except Exception as e:
                         print(f"ID access error: {e}")
 
                 # Pattern 2: Try the tuple directly
                 try:
-                    book_name = A.api.F.book.v(first_book)
+                    book_name = book_v(first_book)
                     print(f"Book name (tuple): '{book_name}'")
                 except Exception as e:
                     print(f"Tuple access error: {e}")
@@ -60,10 +61,10 @@ def test_node_id_formats():
                 for i, book in enumerate(books[:5]):  # First 5 books
                     try:
                         # Try both tuple and individual access
-                        name1 = A.api.F.book.v(book)
+                        name1 = book_v(book)
 
                         if isinstance(book, tuple) and len(book) > 0:
-                            name2 = A.api.F.book.v(book[0])
+                            name2 = book_v(book[0])
                         else:
                             name2 = "N/A"
 
@@ -105,14 +106,10 @@ def test_alternative_node_access():
     print("-" * 40)
 
     try:
-        from tf.fabric import Fabric
-
-        home = Path.home()
-        tf_path = str(home / 'text-fabric-data' / 'github' / 'etcbc' / 'bhsa' / 'tf' / '2021')
+        from bhsa_index import get_fabric
 
         # Load with specific features
-        TF = Fabric(locations=[tf_path], silent=True)
-        api = TF.load('book lex g_word_utf8', silent=True)
+        TF, api = get_fabric('book')
 
         if api:
             print("Direct Fabric loading successful")
@@ -156,13 +153,13 @@ def test_feature_list_and_values():
     print("-" * 40)
 
     try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True)
+        from bhsa_index import get_app, search
+        A = get_app()
 
         if A and hasattr(A, 'api'):
             # Get a sample of different node types
-            books = A.search('book')
-            words = A.search('word')
+            books = search(A, 'book')
+            words = search(A, 'word')
 
             print(f"Testing on {len(books)} books and {len(words)} words")
 
@@ -222,23 +219,22 @@ def run_targeted_fix():
     print("ETCBC BHSA TARGETED FIX")
     print("=" * 50)
 
-    # Method 1: Test node ID formats
-    result1 = test_node_id_formats()
-    if result1[0]:
-        print("\nFIX FOUND: Node ID format issue resolved!")
-        return result1
-
-    # Method 2: Alternative node access
-    result2 = test_alternative_node_access()
-    if result2[0]:
-        print("\nFIX FOUND: Alternative access method works!")
-        return result2
-
-    # Method 3: Feature testing
-    result3 = test_feature_list_and_values()
-    if result3[0]:
-        print("\nFIX FOUND: Working feature identified!")
-        return result3
+    methods = [
+        (test_node_id_formats, "Node ID format issue resolved!"),
+        (test_alternative_node_access, "Alternative access method works!"),
+        (test_feature_list_and_values, "Working feature identified!"),
+    ]
+
+    # Try the probes in order and stop at the first one that works, so the
+    # later (more expensive) probes only run when the earlier ones fail.
+    # They are deliberately not run on a thread pool: they are pure-Python
+    # feature lookups that hold the GIL, so threads would not overlap them,
+    # and running all three would throw away the short-circuit above.
+    for method, message in methods:
+        result = method()
+        if result[0]:
+            print(f"\nFIX FOUND: {message}")
+            return result
 
     print("\nNO FIX FOUND: All methods still return None")
     print("This suggests a deeper data corruption or version compatibility issue")
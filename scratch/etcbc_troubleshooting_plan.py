@@ -10,6 +10,22 @@ import os
 import sys
 from pathlib import Path
 
+UTF8_CODE_PAGE = 65001
+_console_utf8 = False
+
+def set_console_utf8():
+    """Switch the Windows console to UTF-8 via the Win32 API (no chcp subprocess), once."""
+    global _console_utf8
+    if _console_utf8:
+        return
+
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    if kernel32.GetConsoleOutputCP() != UTF8_CODE_PAGE:
+        kernel32.SetConsoleOutputCP(UTF8_CODE_PAGE)
+        kernel32.SetConsoleCP(UTF8_CODE_PAGE)
+    _console_utf8 = True
+
 def step1_environment_setup():
     """Step 1: Fix environment and encoding issues"""
     print("="*60)
@@ -23,8 +39,7 @@ def step1_environment_setup():
     # For Windows, try to set console to UTF-8
     if sys.platform == 'win32':
         try:
-            import subprocess
-            subprocess.run(['chcp', '65001'], shell=True, capture_output=True)
+            set_console_utf8()
             print("✓ Set Windows console to UTF-8")
         except:
             print("⚠ Could not set console encoding")
@@ -32,53 +47,71 @@ def step1_environment_setup():
     print("✓ Environment variables set")
     return True
 
+def dir_entries(path):
+    """Name -> DirEntry for one directory listing ({} if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
 def step2_data_location_check():
     """Step 2: Verify ETCBC data location and integrity"""
     print("\n" + "="*60)
     print("STEP 2: DATA LOCATION CHECK")
     print("="*60)
 
-    # Check expected data locations
+    # Check expected data locations. Each directory is listed once with
+    # scandir; existence checks are then lookups in the parent's listing.
     home = Path.home()
     tf_data_path = home / 'text-fabric-data'
     bhsa_path = tf_data_path / 'github' / 'etcbc' / 'bhsa'
 
+    tf_data_entries = dir_entries(tf_data_path)
+    bhsa_entries = dir_entries(bhsa_path)
+
     print(f"Checking Text-Fabric data path: {tf_data_path}")
-    print(f"  Exists: {tf_data_path.exists()}")
+    print(f"  Exists: {tf_data_path.is_dir()}")
 
-    if tf_data_path.exists():
-        print(f"Contents: {list(tf_data_path.iterdir())}")
+    if tf_data_entries:
+        print(f"Contents: {sorted(tf_data_entries)}")
 
+    bhsa_exists = bool(bhsa_entries) or bhsa_path.is_dir()
     print(f"\nChecking BHSA path: {bhsa_path}")
-    print(f"  Exists: {bhsa_path.exists()}")
+    print(f"  Exists: {bhsa_exists}")
 
-    if bhsa_path.exists():
-        print(f"Contents: {list(bhsa_path.iterdir())}")
+    if bhsa_exists:
+        print(f"Contents: {sorted(bhsa_entries)}")
 
         # Check for TF data
-        tf_path = bhsa_path / 'tf'
-        if tf_path.exists():
-            print(f"TF data: {list(tf_path.iterdir())}")
+        if 'tf' in bhsa_entries:
+            tf_path = bhsa_path / 'tf'
+            tf_entries = dir_entries(tf_path)
+            print(f"TF data: {sorted(tf_entries)}")
 
             # Check 2021 version specifically
-            tf_2021 = tf_path / '2021'
-            if tf_2021.exists():
-                print(f"2021 data files: {len(list(tf_2021.iterdir()))} files")
+            if '2021' in tf_entries:
+                tf_2021_entries = dir_entries(tf_path / '2021')
+                print(f"2021 data files: {len(tf_2021_entries)} files")
 
                 # Check for key features
                 key_features = ['lex.tf', 'book.tf', 'g_word_utf8.tf']
                 for feature in key_features:
-                    feature_file = tf_2021 / feature
-                    print(f"  {feature}: {feature_file.exists()}")
+                    print(f"  {feature}: {feature in tf_2021_entries}")
             else:
                 print("⚠ 2021 version not found")
         else:
             print("⚠ TF directory not found")
 
-    return bhsa_path.exists()
+    return bhsa_exists
 
 def step3_minimal_tf_test():
-    """Step 3: Test minimal Text-Fabric loading"""
+    """
+    Step 3: Test minimal Text-Fabric loading.
+
+    Returns 'ok', or the failure mode for step 4: 'import-err', 'api-none'
+    (load returned no API) or 'feature-none' (API loaded, features unreadable).
+    """
     print("\n" + "="*60)
     print("STEP 3: MINIMAL TEXT-FABRIC TEST")
     print("="*60)
@@ -102,87 +135,96 @@ def step3_minimal_tf_test():
             print("✓ Minimal feature loading successful")
             print(f"✓ API object created: {type(api)}")
 
-            # Test basic access
+            # Test basic access: one book name is enough to know features
+            # work, so stop at the first book instead of counting all nodes
             try:
-                # Get node counts
-                print(f"Book nodes: {len(list(TF.search('book')))}")
-                print(f"Word nodes: {len(list(TF.search('word')))}")
+                first_book = next(iter(api.F.otype.s('book')), None)
 
                 # Test feature access
-                books = list(TF.search('book'))
-                if books:
-                    first_book = books[0]
+                if first_book is not None:
                     book_name = api.F.book.v(first_book)
                     print(f"First book name: '{book_name}'")
 
                     if book_name:
                         print("✓ Feature access working!")
-                        return True
+                        return 'ok'
                     else:
                         print("⚠ Feature returns None")
-                        return False
+                        return 'feature-none'
             except Exception as e:
                 print(f"⚠ Error in feature access: {e}")
-                return False
+            return 'feature-none'
         else:
             print("⚠ API loading failed")
-            return False
+            return 'api-none'
 
+    except ImportError as e:
+        print(f"⚠ Text-Fabric import error: {e}")
+        return 'import-err'
     except Exception as e:
-        print(f"⚠ Text-Fabric import/loading error: {e}")
-        return False
-
-def step4_alternative_approaches():
-    """Step 4: Try alternative access methods"""
+        print(f"⚠ Text-Fabric loading error: {e}")
+        return 'api-none'
+
+def step4_alternative_approaches(reason=None):
+    """
+    Step 4: Try alternative access methods, only those that can help with the
+    step 3 failure `reason` (all of them if it is not known)
+    """
     print("\n" + "="*60)
     print("STEP 4: ALTERNATIVE APPROACHES")
     print("="*60)
 
-    # Approach 1: Use app with specific features
-    print("Approach 1: App with specific features")
-    try:
-        from tf.app import use
-        A = use('etcbc/bhsa', silent=True, features=['book', 'lex'])
-
-        if A:
-            print("✓ App loading with specific features successful")
-
-            # Test search and feature access
-            books = A.search('book')
-            print(f"Found {len(books)} books")
-
-            if books:
-                test_book = books[0]
-                try:
-                    book_name = A.api.F.book.v(test_book)
-                    print(f"Book name: '{book_name}'")
-
-                    if book_name and book_name != 'None':
-                        print("✓ Approach 1 working!")
-                        return A
-                except Exception as e:
-                    print(f"Feature access error: {e}")
-        else:
-            print("⚠ App loading failed")
-    except Exception as e:
-        print(f"⚠ App approach error: {e}")
+    if reason == 'import-err':
+        print("⚠ Text-Fabric cannot be imported; reinstall it before trying other loaders")
+        return None
 
-    # Approach 2: Direct TF with verbose output
-    print("\nApproach 2: Direct TF with verbose output")
-    try:
-        from tf.fabric import Fabric
+    # Approach 1: Use app with specific features (features were unreadable)
+    if reason in (None, 'feature-none'):
+        print("Approach 1: App with specific features")
+        try:
+            from tf.app import use
+            A = use('etcbc/bhsa', silent=True, features=['book', 'lex'])
 
-        home = Path.home()
-        tf_path = str(home / 'text-fabric-data' / 'github' / 'etcbc' / 'bhsa' / 'tf' / '2021')
+            if A:
+                print("✓ App loading with specific features successful")
 
-        TF = Fabric(locations=[tf_path])  # Not silent
-        api = TF.load('')  # Load all features
+                # Test feature access on the book nodes (from the otype index)
+                books = A.api.F.otype.s('book')
+                print(f"Found {len(books)} books")
 
-        if api:
-            print("✓ Full feature loading successful")
-            return api
-    except Exception as e:
-        print(f"⚠ Direct TF approach error: {e}")
+                if books:
+                    test_book = books[0]
+                    try:
+                        book_name = A.api.F.book.v(test_book)
+                        print(f"Book name: '{book_name}'")
+
+                        if book_name and book_name != 'None':
+                            print("✓ Approach 1 working!")
+                            return A
+                    except Exception as e:
+                        print(f"Feature access error: {e}")
+            else:
+                print("⚠ App loading failed")
+        except Exception as e:
+            print(f"⚠ App approach error: {e}")
+
+    # Approach 2: Direct TF with verbose output (the API itself did not load)
+    if reason in (None, 'api-none'):
+        print("\nApproach 2: Direct TF with verbose output")
+        try:
+            from tf.fabric import Fabric
+
+            home = Path.home()
+            tf_path = str(home / 'text-fabric-data' / 'github' / 'etcbc' / 'bhsa' / 'tf' / '2021')
+
+            TF = Fabric(locations=[tf_path])  # Not silent
+            api = TF.load('')  # Load all features
+
+            if api:
+                print("✓ Feature loading successful")
+                return api
+        except Exception as e:
+            print(f"⚠ Direct TF approach error: {e}")
 
     return None
 
@@ -215,13 +257,14 @@ def run_full_diagnosis():
 
     # Step 3: Minimal test
     api = None
-    if step3_minimal_tf_test():
+    reason = step3_minimal_tf_test()
+    if reason == 'ok':
         print("\n✅ SUCCESS: Minimal Text-Fabric working!")
     else:
-        print("\n⚠ Minimal test failed, trying alternatives...")
+        print(f"\n⚠ Minimal test failed ({reason}), trying alternatives...")
 
         # Step 4: Alternative approaches
-        api = step4_alternative_approaches()
+        api = step4_alternative_approaches(reason)
 
         if api:
             print("\n✅ SUCCESS: Alternative approach working!")
@@ -3,10 +3,17 @@
 
 import os
 import sys
+from itertools import islice
 
 # Set environment to handle Unicode properly
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+from bhsa_index import TF_DIR
+
+# Fail fast on missing data before paying for the Text-Fabric import
+if not TF_DIR.is_dir():
+    sys.exit(f"BHSA data not found at {TF_DIR}")
+
 from tf.core.api import TF
 
 # Try direct TF approach instead of app
@@ -23,7 +30,7 @@ if result:
     L = TF.L  # Locality
 
     # Get some words
-    words = list(TF.nodes())[TF.nodeRank['word'][0]:TF.nodeRank['word'][0]+10]
+    words = list(islice(F.otype.s('word'), 10))
     print(f"First 10 word nodes: {words}")
 
     # Test features
@@ -33,7 +40,7 @@ if result:
         print(f"Word {word}: lex='{lex}', g_word='{g_word}'")
 
     # Test getting books
-    book_nodes = list(TF.nodes())[TF.nodeRank['book'][0]:TF.nodeRank['book'][0]+5]
+    book_nodes = list(islice(F.otype.s('book'), 5))
     print(f"First 5 book nodes: {book_nodes}")
 
     for book in book_nodes:
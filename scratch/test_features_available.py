@@ -4,16 +4,16 @@
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from tf.app import use
+from bhsa_index import VERBOSE, book_word_ids, get_app, get_feature
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 if A and hasattr(A, 'api'):
     print("Testing feature access...")
 
     # Get a few words from Job
-    job_words = A.search('book book=Iob\n<< word')
+    job_words = book_word_ids(A, 'Iob')
     print(f"Found {len(job_words)} words in Job")
 
     if job_words:
@@ -28,8 +28,9 @@ if A and hasattr(A, 'api'):
 
         for feature in features_to_test:
             try:
-                if hasattr(A.api.F, feature):
-                    value = getattr(A.api.F, feature).v(test_word)
+                feature_obj = get_feature(A, feature)
+                if feature_obj is not None:
+                    value = feature_obj.v(test_word)
                     print(f"  {feature}: '{value}' (type: {type(value)})")
                 else:
                     print(f"  {feature}: FEATURE NOT AVAILABLE")
@@ -37,21 +38,22 @@ if A and hasattr(A, 'api'):
                 print(f"  {feature}: ERROR - {e}")
 
         # Test if we can get the text content directly
-        print(f"\nTesting alternative text access:")
-        try:
-            # Use the show method to see what's actually there
-            print("Using A.show():")
-            A.show([test_word], extraFeatures=['lex', 'g_word_utf8'])
-        except Exception as e:
-            print(f"Show method error: {e}")
+        if VERBOSE:
+            print(f"\nTesting alternative text access:")
+            try:
+                # Use the show method to see what's actually there
+                print("Using A.show():")
+                A.show([test_word], extraFeatures=['lex', 'g_word_utf8'])
+            except Exception as e:
+                print(f"Show method error: {e}")
 
         # Check if the feature is loaded
         print(f"\nChecking loaded features:")
         if hasattr(A.api, 'TF'):
-            loaded_features = list(A.api.TF.features.keys())
-            print(f"Loaded features count: {len(loaded_features)}")
-            lex_features = [f for f in loaded_features if 'lex' in f]
-            print(f"Lexeme-related features: {lex_features}")
+            print(f"Loaded features count: {len(A.api.TF.features)}")
+            if VERBOSE:
+                lex_features = [f for f in A.api.TF.features if 'lex' in f]
+                print(f"Lexeme-related features: {lex_features}")
 
 else:
     print("Failed to load dataset")
\ No newline at end of file
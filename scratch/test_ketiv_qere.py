@@ -5,6 +5,12 @@ import re
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+# Ketiv with its qere marker (*ketiv **), or a lone qere marker (**): both removed
+KETIV_QERE_RE = re.compile(r'\*\S+\s+\*\*|\*\*')
+# A run of characters between whitespace/maqqeph that holds at least one
+# Hebrew-block character (the maqqeph itself, U+05BE, does not count)
+WORD_PART_RE = re.compile('[^\\s\u05BE]*[\u0590-\u05BD\u05BF-\u05FF][^\\s\u05BE]*')
+
 # Test cases from Proverbs 2:7-8
 test_verse_7 = "*וצפן **יִצְפֹּ֣ן לַ֭יְשָׁרִים תּוּשִׁיָּ֑ה מָ֝גֵ֗ן לְהֹ֣לְכֵי תֹֽם"
 test_verse_8 = "לִ֭נְצֹר אָרְח֣וֹת מִשְׁפָּ֑ט וְדֶ֖רֶךְ *חסידו **חֲסִידָ֣יו יִשְׁמֹֽר"
@@ -19,10 +25,8 @@ print()
 
 # Process ketiv/qere
 def process_ketiv_qere(text):
-    # Remove ketiv (marked with *word), keep qere (marked with **word)
-    text = re.sub(r'\*\S+\s+\*\*', '**', text)  # Remove ketiv, leave qere marker
-    text = re.sub(r'\*\*', '', text)  # Remove qere marker
-    return text
+    # Remove ketiv (marked with *word), keep qere (marked with **word), in one pass
+    return KETIV_QERE_RE.sub('', text)
 
 processed_7 = process_ketiv_qere(test_verse_7)
 processed_8 = process_ketiv_qere(test_verse_8)
@@ -37,13 +41,8 @@ print()
 
 # Count words
 def count_words(text):
-    words = []
-    for word_group in text.split():
-        maqqeph_parts = word_group.split('־')
-        for part in maqqeph_parts:
-            if part.strip() and any('\u0590' <= c <= '\u05FF' for c in part):
-                words.append(part.strip())
-    return words
+    # Whitespace/maqqeph-separated parts that contain a Hebrew character
+    return WORD_PART_RE.findall(text)
 
 words_7_orig = count_words(test_verse_7)
 words_7_proc = count_words(processed_7)
@@ -4,10 +4,10 @@
 import os
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from tf.app import use
+from bhsa_index import book_word_ids, get_app, get_feature
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 if A and hasattr(A, 'api'):
     print("Testing node types and lexeme access...")
@@ -36,7 +36,11 @@ if A and hasattr(A, 'api'):
             # Test features on lexeme nodes
             for feature in ['lex', 'g_lex_utf8', 'freq_lex']:
                 try:
-                    value = getattr(A.api.F, feature).v(test_lex)
+                    feature_obj = get_feature(A, feature)
+                    if feature_obj is None:
+                        print(f"  {feature}: FEATURE NOT AVAILABLE")
+                        continue
+                    value = feature_obj.v(test_lex)
                     print(f"  {feature}: '{value}'")
                 except Exception as e:
                     print(f"  {feature}: ERROR - {e}")
@@ -48,8 +52,8 @@ if A and hasattr(A, 'api'):
     try:
         print(f"\nTesting word-to-lexeme relationships:")
 
-        # Get words differently
-        all_words = A.search('word')
+        # Get words differently: all word nodes straight from otype, no search
+        all_words = A.api.F.otype.s('word')
         print(f"Total words in corpus: {len(all_words)}")
 
         if all_words:
@@ -73,7 +77,10 @@ if A and hasattr(A, 'api'):
             try:
                 # Maybe the features work on different node types
                 for feature in ['g_word_utf8', 'g_cons_utf8']:
-                    value = getattr(A.api.F, feature).v(test_word)
+                    feature_obj = get_feature(A, feature)
+                    if feature_obj is None:
+                        continue
+                    value = feature_obj.v(test_word)
                     if value:
                         print(f"  {feature}: '{value}' (SUCCESS!)")
                         break
@@ -87,7 +94,7 @@ if A and hasattr(A, 'api'):
     # Approach 3: Check specific Job words with context
     try:
         print(f"\nTesting Job words with more context:")
-        job_words = A.search('book book=Iob\n<< word')
+        job_words = book_word_ids(A, 'Iob')
 
         if job_words:
             # Try multiple words to see if any work
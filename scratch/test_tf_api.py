@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Test script to understand Text-Fabric API"""
 
-from tf.app import use
+from bhsa_index import get_app
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 print("Available attributes on A:")
 print([attr for attr in dir(A) if not attr.startswith('_')])
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Test script to understand Text-Fabric API structure"""
 
-from tf.app import use
+from bhsa_index import get_app, search
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 print("A.api attributes:")
 print([attr for attr in dir(A.api) if not attr.startswith('_')])
@@ -28,16 +28,13 @@ if hasattr(A.api, 'F'):
 
 # Test word search in Job
 print("\nSearching for words in Job...")
-job_words = A.search('''
-book book=Job
+job_words = search(A, '''
+book book=Iob
 << word
-''')
+''')  # BHSA uses Latin book names; each result is a (book, word) pair
 print(f"Found {len(job_words)} words in Job")
 
 if job_words and hasattr(A.api.F, 'lex'):
     print("Testing lexeme extraction...")
-    first_few_lexemes = []
-    for word in job_words[:10]:
-        lexeme = A.api.F.lex.v(word)
-        first_few_lexemes.append(lexeme)
+    first_few_lexemes = [A.api.F.lex.data.get(word) for _book, word in job_words[:10]]
     print("First 10 lexemes:", first_few_lexemes)
\ No newline at end of file
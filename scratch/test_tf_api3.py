@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Test script to find Job and understand search syntax"""
 
-from tf.app import use
+from bhsa_index import book_nodes, get_app, search
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 # List all books to find Job
 print("All books in the corpus:")
@@ -13,13 +13,13 @@ for freq, book in books:
     print(f"  {book}: {freq} chapters")
 
 # Search for Job specifically
-job_books = A.search('book book=Job')
+job_books = search(A, 'book book=Job')
 print(f"\nSearch results for 'book book=Job': {len(job_books)} results")
 
-# Try different variations
-variations = ['Iobus', 'Hiob', 'Ijob', 'Job']
+# Try different variations ('Iob' is the name BHSA actually uses)
+variations = ['Iob', 'Iobus', 'Hiob', 'Ijob', 'Job']
 for variation in variations:
-    results = A.search(f'book book={variation}')
+    results = search(A, f'book book={variation}')
     print(f"Search for '{variation}': {len(results)} results")
 
 # Test word search with correct syntax
@@ -45,10 +45,8 @@ except Exception as e:
 
 # Try a different approach - get books directly and then find words
 print("\nTrying direct book node approach...")
-book_nodes = A.search('book')
-print(f"Found {len(book_nodes)} book nodes")
+book_index = book_nodes(A)  # Name -> book node, built once
+print(f"Found {len(book_index)} book nodes")
 
-if book_nodes:
-    for book_node in book_nodes[:5]:  # Test first 5 books
-        book_name = A.api.F.book.v(book_node)
-        print(f"Book node {book_node}: '{book_name}'")
\ No newline at end of file
+for book_name, book_node in list(book_index.items())[:5]:  # First 5 books
+    print(f"Book node {book_node}: '{book_name}'")
\ No newline at end of file
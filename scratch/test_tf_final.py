@@ -1,32 +1,28 @@
 #!/usr/bin/env python3
 """Final test to get the correct Text-Fabric approach"""
 
-from tf.app import use
+from bhsa_index import book_nodes, get_app, search
 
 # Load dataset
-A = use('etcbc/bhsa', silent=True)
+A = get_app()
 
 # Test the correct approach
 print("Testing correct search approach...")
 
-# Method 1: Get all words in Iob
-words_in_iob = A.search('book book=Iob\n<< word')
+# Method 1: Get all words in Iob (each result is a (book, word) pair)
+words_in_iob = search(A, 'book book=Iob\n<< word')
 print(f"Words in Iob: {len(words_in_iob)}")
 
 if words_in_iob:
     # Test getting lexemes
-    lexemes = []
-    for i, word in enumerate(words_in_iob[:20]):  # First 20 words
-        lexeme = A.api.F.lex.v(word)
-        if lexeme:
-            lexemes.append(lexeme)
+    lexemes = [lexeme for _book, word in words_in_iob[:20]  # First 20 words
+               if (lexeme := A.api.F.lex.data.get(word))]
     print(f"First 20 lexemes: {lexemes}")
 
 # Test book name extraction
 print("\nTesting book names...")
-book_nodes = A.search('book')
-for book_node in book_nodes[:5]:
-    book_name = A.api.F.book.v(book_node)
+book_index = book_nodes(A)  # Name -> book node, built once
+for book_name in list(book_index)[:5]:
     print(f"Book: {book_name}")
 
 # Test correct freqList usage
@@ -37,9 +33,4 @@ print("First 5 items:", freq_list[:5])
 
 # Check how to get book names properly
 print("\nAll unique book names:")
-unique_books = set()
-for book_node in book_nodes:
-    book_name = A.api.F.book.v(book_node)
-    if book_name:
-        unique_books.add(book_name)
-print(sorted(unique_books))
\ No newline at end of file
+print(sorted(book_name for book_name in book_index if book_name))
\ No newline at end of file
@@ -3,16 +3,16 @@
 
 import os
 import sys
+from itertools import islice
 
 # Set environment variables for proper Unicode handling
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 try:
-    from tf.fabric import Fabric
+    from bhsa_index import get_fabric
 
     # Load the dataset with minimal features
-    TF = Fabric(locations=['~/text-fabric-data/github/etcbc/bhsa/tf/2021'], silent=True)
-    api = TF.load('')
+    _, api = get_fabric('')
 
     if api:
         print("Dataset loaded with minimal approach!")
@@ -22,7 +22,7 @@ try:
         L = api.L
 
         # Get word count
-        word_nodes = list(api.nodes())[api.nodeRank['word'][0]:api.nodeRank['word'][0]+5]
+        word_nodes = list(islice(F.otype.s('word'), 5))
         print(f"First 5 words: {word_nodes}")
 
         # Test features
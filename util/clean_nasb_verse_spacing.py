@@ -7,66 +7,70 @@ Clean up NASB text files to ensure consistent verse spacing.
 import os
 import re
 
+# Chapter headers look like: "BookName N New American Standard Bible"
+CHAPTER_HEADER = r'[^\S\n]*[A-Za-z0-9_ ]+ \d+ New American Standard Bible'
+CHAPTER_HEADER_AT_END_RE = re.compile(rf'^{CHAPTER_HEADER}[^\n]*\n\s*\Z', re.MULTILINE)
+BEFORE_CHAPTER_HEADER_RE = re.compile(rf'\n(?={CHAPTER_HEADER})')
+AFTER_CHAPTER_HEADER_RE = re.compile(rf'^{CHAPTER_HEADER}[^\n]*\n(?!\n)', re.MULTILINE)
+# Leading blank lines, and the newline + content of every other blank line
+BLANK_LINE_RE = re.compile(r'\A(?:[^\S\n]*(?:\n|\Z))+|\n[^\S\n]*(?=\n|\Z)')
+WHITESPACE_LINE_RE = re.compile(r'\n[ \t]+\n')
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
 # Path to NASB books directory
 books_dir = os.path.join('..', 'texts', 'nasb', 'books')
 
-# Get all .txt files
-txt_files = [f for f in os.listdir(books_dir) if f.endswith('.txt')]
-
-print(f"Found {len(txt_files)} NASB text files to process")
-
-for filename in txt_files:
-    filepath = os.path.join(books_dir, filename)
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+def clean_spacing(content):
+    """Drop blank lines between verses, keeping one on each side of chapter headers."""
     # Replace multiple consecutive newlines with double newlines (preserve chapter breaks)
     # Then replace double newlines that aren't around chapter headers with single newlines
 
     # First, normalize all whitespace-only lines to actual blank lines
-    content = re.sub(r'\n[ \t]+\n', '\n\n', content)
+    content = WHITESPACE_LINE_RE.sub('\n\n', content)
 
     # Replace 3+ consecutive newlines with exactly 2 (for chapter breaks)
-    content = re.sub(r'\n{3,}', '\n\n', content)
-
-    # Now we need to identify chapter headers and preserve spacing around them
-    # Chapter headers look like: "BookName N New American Standard Bible"
-    lines = content.split('\n')
-
-    cleaned_lines = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check if this is a chapter header
-        is_chapter_header = re.match(r'^[A-Za-z0-9_ ]+ \d+ New American Standard Bible', line.strip())
-
-        if is_chapter_header:
-            # Ensure blank line before chapter header (unless it's the first line)
-            if cleaned_lines and cleaned_lines[-1] != '':
-                cleaned_lines.append('')
-            cleaned_lines.append(line)
-            # Ensure blank line after chapter header
-            if i + 1 < len(lines) and lines[i + 1].strip() != '':
-                cleaned_lines.append('')
-        elif line.strip() == '':
-            # Only add blank line if previous line was a chapter header
-            if cleaned_lines and re.match(r'^[A-Za-z0-9_ ]+ \d+ New American Standard Bible', cleaned_lines[-1].strip()):
-                cleaned_lines.append(line)
-            # Otherwise skip blank lines between verses
-        else:
-            # Regular verse line
-            cleaned_lines.append(line)
-
-        i += 1
-
-    # Join lines and write back
-    cleaned_content = '\n'.join(cleaned_lines)
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(cleaned_content)
-
-    print(f"Processed {filename}")
-
-print("\nAll files processed!")
+    content = EXTRA_NEWLINES_RE.sub('\n\n', content)
+
+    # Now we need to identify chapter headers and preserve spacing around them.
+    # A header that had anything after it keeps one blank line after it, even at
+    # the end of the file, so note that before the blank lines are dropped
+    ends_after_header = CHAPTER_HEADER_AT_END_RE.search(content) is not None
+
+    # Drop every blank line, so verses are separated by single newlines
+    content = BLANK_LINE_RE.sub('', content)
+
+    # Put exactly one blank line on each side of every chapter header
+    content = BEFORE_CHAPTER_HEADER_RE.sub('\n\n', content)
+    content = AFTER_CHAPTER_HEADER_RE.sub('\\g<0>\n', content)
+
+    return content + '\n' if ends_after_header else content
+
+def main():
+    # Get all .txt files
+    with os.scandir(books_dir) as entries:
+        txt_files = [entry for entry in entries if entry.is_file() and entry.name.endswith('.txt')]
+
+    print(f"Found {len(txt_files)} NASB text files to process")
+
+    for entry in txt_files:
+        filename, filepath = entry.name, entry.path
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        cleaned_content = clean_spacing(content)
+
+        # Leave already-clean files untouched
+        if cleaned_content == content:
+            print(f"Processed {filename}: no changes needed")
+            continue
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(cleaned_content)
+
+        print(f"Processed {filename}")
+
+    print("\nAll files processed!")
+
+if __name__ == '__main__':
+    main()
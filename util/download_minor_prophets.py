@@ -4,8 +4,10 @@ Download the 12 Minor Prophets individually from tanach.us
 """
 
 import os
-import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from download_tanakh import MAX_WORKERS, download_book
 
 def download_minor_prophets():
     """Download the 12 Minor Prophets individually."""
@@ -21,44 +23,13 @@ def download_minor_prophets():
 
     base_url = "https://www.tanach.us/Server.txt"
 
-    successful_downloads = 0
-    failed_downloads = []
-
-    for book in minor_prophets:
-        try:
-            # Construct URL
-            params = f"{book}*&content=Accents"
-            url = f"{base_url}?{params}"
-
-            print(f"Downloading {book}...")
-
-            # Download the content
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-
-            # Skip if content is too short (likely an error)
-            if len(content.strip()) < 100:
-                print(f"Warning: {book} returned very short content, skipping")
-                failed_downloads.append(book)
-                continue
-
-            # Save to file
-            filename = f"{book.lower()}.txt"
-            filepath = os.path.join(output_dir, filename)
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"[OK] Saved {book} to {filename}")
-            successful_downloads += 1
-
-            # Be respectful - small delay between requests
-            time.sleep(0.5)
+    # Fetch several books at once; each worker still pauses after its request
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(partial(download_book, base_url=base_url, output_dir=output_dir),
+                                    minor_prophets))
 
-        except Exception as e:
-            print(f"[FAIL] Failed to download {book}: {str(e)}")
-            failed_downloads.append(book)
-            continue
+    successful_downloads = results.count(True)
+    failed_downloads = [book for book, ok in zip(minor_prophets, results) if not ok]
 
     print(f"\nMinor Prophets Download Summary:")
     print(f"Successful downloads: {successful_downloads}")
@@ -4,9 +4,15 @@ Download the SBL Greek New Testament (SBLGNT) text.
 The SBLGNT is freely available under Creative Commons Attribution 4.0 license.
 """
 
+import http.client
 import os
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from keepalive import fetch
+
+# Download worker threads; keepalive.MAX_PER_HOST caps requests per host
+MAX_WORKERS = 4
 
 def create_output_directory():
     """Create the output directory if it doesn't exist."""
@@ -14,6 +20,27 @@ def create_output_directory():
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
+def download_book(book, base_url, output_dir):
+    """Download one SBLGNT book; return True if it was saved or is current."""
+    book_url = f"{base_url}{book}.txt"
+    output_file = os.path.join(output_dir, f"{book.lower()}.txt")
+
+    try:
+        # Only download again if the server has something newer than our copy
+        modified_since = os.path.getmtime(output_file) if os.path.exists(output_file) else None
+        content = fetch(book_url, modified_since)
+        if content is None:
+            print(f"[OK] {book} is unchanged")
+            return True
+
+        with open(output_file, 'wb') as f:
+            f.write(content)
+        print(f"[OK] Downloaded {book}")
+        return True
+    except (OSError, http.client.HTTPException) as e:  # URLError is an OSError
+        print(f"[FAIL] Could not download {book}: {e}")
+        return False
+
 def download_sbl_greek_nt():
     """Download all SBL Greek New Testament books from GitHub."""
     output_dir = create_output_directory()
@@ -26,22 +53,16 @@ def download_sbl_greek_nt():
     ]
 
     base_url = "https://raw.githubusercontent.com/LogosBible/SBLGNT/master/data/sblgnt/text/"
-    successful_downloads = 0
-    failed_downloads = 0
 
     print(f"Downloading {len(books)} Greek NT books from SBLGNT repository...")
 
-    for book in books:
-        book_url = f"{base_url}{book}.txt"
-        output_file = os.path.join(output_dir, f"{book.lower()}.txt")
-
-        try:
-            urllib.request.urlretrieve(book_url, output_file)
-            print(f"[OK] Downloaded {book}")
-            successful_downloads += 1
-        except urllib.error.URLError as e:
-            print(f"[FAIL] Could not download {book}: {e}")
-            failed_downloads += 1
+    # Fetch several books at once rather than one round trip after another
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(partial(download_book, base_url=base_url, output_dir=output_dir),
+                                    books))
+
+    successful_downloads = results.count(True)
+    failed_downloads = len(results) - successful_downloads
 
     print(f"\nDownload complete: {successful_downloads} successful, {failed_downloads} failed")
     return failed_downloads == 0
@@ -5,8 +5,55 @@ Download Hebrew Tanakh books from tanach.us with accents.
 
 import os
 import time
-import urllib.request
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from keepalive import fetch
+
+# Download worker threads; keepalive.MAX_PER_HOST still caps how many of them
+# talk to tanach.us at once
+MAX_WORKERS = 4
+
+def download_book(book, base_url, output_dir):
+    """Download one book with Hebrew accents; return True if it was saved or is current."""
+    try:
+        # Construct URL: Server.txt?BookName*&content=Accents
+        params = f"{book}*&content=Accents"
+        url = f"{base_url}?{params}"
+
+        filename = f"{book.lower()}.txt"
+        filepath = os.path.join(output_dir, filename)
+
+        print(f"Downloading {book}...")
+
+        # Download the content over this worker's kept-alive connection, only
+        # if the server has something newer than the copy already on disk
+        modified_since = os.path.getmtime(filepath) if os.path.exists(filepath) else None
+        content = fetch(url, modified_since)
+        if content is None:
+            print(f"[OK] {book} is unchanged, keeping {filename}")
+            time.sleep(0.5)  # Still a request to tanach.us; keep the same pause
+            return True
+        content = content.decode('utf-8')
+
+        # Skip if content is too short (likely an error)
+        if len(content.strip()) < 100:
+            print(f"Warning: {book} returned very short content, skipping")
+            return False
+
+        # Save to file
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        print(f"[OK] Saved {book} to {filename}")
+
+        # Be respectful - small delay between requests
+        time.sleep(0.5)
+        return True
+
+    except Exception as e:
+        print(f"[FAIL] Failed to download {book}: {str(e)}")
+        return False
 
 def download_tanakh_books():
     """Download all Tanakh books from tanach.us with Hebrew accents."""
@@ -33,44 +80,13 @@ def download_tanakh_books():
 
     base_url = "https://www.tanach.us/Server.txt"
 
-    successful_downloads = 0
-    failed_downloads = []
-
-    for book in tanakh_books:
-        try:
-            # Construct URL: Server.txt?BookName*&content=Accents
-            params = f"{book}*&content=Accents"
-            url = f"{base_url}?{params}"
-
-            print(f"Downloading {book}...")
-
-            # Download the content
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-
-            # Skip if content is too short (likely an error)
-            if len(content.strip()) < 100:
-                print(f"Warning: {book} returned very short content, skipping")
-                failed_downloads.append(book)
-                continue
-
-            # Save to file
-            filename = f"{book.lower()}.txt"
-            filepath = os.path.join(output_dir, filename)
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"[OK] Saved {book} to {filename}")
-            successful_downloads += 1
-
-            # Be respectful - small delay between requests
-            time.sleep(0.5)
+    # Fetch several books at once; each worker still pauses after its request
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(partial(download_book, base_url=base_url, output_dir=output_dir),
+                                    tanakh_books))
 
-        except Exception as e:
-            print(f"[FAIL] Failed to download {book}: {str(e)}")
-            failed_downloads.append(book)
-            continue
+    successful_downloads = results.count(True)
+    failed_downloads = [book for book, ok in zip(tanakh_books, results) if not ok]
 
     print(f"\nDownload Summary:")
     print(f"Successful downloads: {successful_downloads}")
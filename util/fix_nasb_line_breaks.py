@@ -14,54 +14,75 @@ The script:
 """
 
 import os
-import re
 from pathlib import Path
 
-def fix_verse_line_breaks(file_path):
-    """Fix line breaks in a single NASB book file."""
-    print(f"Processing {file_path.name}...")
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
+def is_verse_start(line):
+    """True if the line starts with a verse number and whitespace (r'^\\d+\\s' without re)."""
+    rest = line.lstrip('0123456789')
+    return len(rest) < len(line) and rest[:1].isspace()
+
+def fix_line_breaks(lines):
+    """
+    Fold continuation lines into their verse; return (fixed_lines, changed),
+    where changed says whether writing fixed_lines back (one per line, each
+    newline-terminated) would alter the original text.
+    """
     fixed_lines = []
-    current_verse = None
+    current_parts = None  # Lines of the pending verse, joined once it ends
+    changed = False  # Whether the output will differ from the input
 
     for line in lines:
+        # Only the last line can lack its newline; writing it back adds one
+        changed = changed or not line.endswith('\n')
         line = line.rstrip('\n')
 
         # Check if this is a verse beginning (starts with a number)
         # or a chapter header (contains book name)
-        if re.match(r'^\d+\s', line) or 'New American Standard Bible' in line:
+        if is_verse_start(line) or 'New American Standard Bible' in line:
             # If we have a pending verse, add it first
-            if current_verse is not None:
-                fixed_lines.append(current_verse)
-                current_verse = None
+            if current_parts is not None:
+                fixed_lines.append(' '.join(current_parts))
+                current_parts = None
 
             # Start a new verse
-            current_verse = line
+            current_parts = [line]
         elif line.strip() == '':
             # Empty line - add any pending verse first, then the blank line
-            if current_verse is not None:
-                fixed_lines.append(current_verse)
-                current_verse = None
+            changed = changed or line != ''
+            if current_parts is not None:
+                fixed_lines.append(' '.join(current_parts))
+                current_parts = None
             fixed_lines.append('')
         else:
             # Continuation of current verse
-            if current_verse is not None:
-                current_verse += ' ' + line.strip()
+            if current_parts is not None:
+                current_parts.append(line.strip())
+                changed = True
             else:
                 # Edge case: non-verse text without a pending verse
                 fixed_lines.append(line)
 
     # Don't forget the last verse if there is one
-    if current_verse is not None:
-        fixed_lines.append(current_verse)
+    if current_parts is not None:
+        fixed_lines.append(' '.join(current_parts))
+
+    return fixed_lines, changed
+
+def fix_verse_line_breaks(file_path):
+    """Fix line breaks in a single NASB book file."""
+    print(f"Processing {file_path.name}...")
+
+    # Walk the file line by line rather than materializing it with readlines()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        fixed_lines, changed = fix_line_breaks(f)
+
+    if not changed:
+        print(f"  No changes needed in {file_path.name}")
+        return
 
-    # Write back to file
+    # Write back to file in a single call rather than one write per line
     with open(file_path, 'w', encoding='utf-8') as f:
-        for line in fixed_lines:
-            f.write(line + '\n')
+        f.write(''.join(line + '\n' for line in fixed_lines))
 
     print(f"  Fixed {file_path.name}")
 
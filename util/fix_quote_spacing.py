@@ -11,36 +11,46 @@ Should be:
 import os
 import re
 
+# Verse number, space, quote, stray space, then the quoted text's first letter
+QUOTE_SPACE_RE = re.compile(r'^(\d+) " ([A-Z])', re.MULTILINE)
+
 # Path to NASB books directory
 books_dir = os.path.join('texts', 'nasb', 'books')
 
-# Get all .txt files
-txt_files = [f for f in os.listdir(books_dir) if f.endswith('.txt')]
+def fix_quotes(content):
+    """Remove the space after an opening quote at a verse start; return (text, fixes)."""
+    # Fix pattern: verse_number space quote space uppercase_letter
+    # Replace with: verse_number space quote uppercase_letter,
+    # counting the fixes in the same pass
+    return QUOTE_SPACE_RE.subn(r'\1 "\2', content)
+
+def main():
+    # Get all .txt files
+    with os.scandir(books_dir) as entries:
+        txt_files = [entry for entry in entries if entry.is_file() and entry.name.endswith('.txt')]
 
-print(f"Found {len(txt_files)} NASB text files to process")
+    print(f"Found {len(txt_files)} NASB text files to process")
 
-total_fixes = 0
+    total_fixes = 0
 
-for filename in txt_files:
-    filepath = os.path.join(books_dir, filename)
+    for entry in txt_files:
+        filename, filepath = entry.name, entry.path
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-    # Fix pattern: verse_number space quote space uppercase_letter
-    # Replace with: verse_number space quote uppercase_letter
-    fixed_content = re.sub(r'^(\d+) " ([A-Z])', r'\1 "\2', content, flags=re.MULTILINE)
+        fixed_content, fixes_in_file = fix_quotes(content)
 
-    # Count how many fixes were made
-    fixes_in_file = len(re.findall(r'^\d+ " [A-Z]', content, flags=re.MULTILINE))
+        if fixes_in_file > 0:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(fixed_content)
 
-    if fixes_in_file > 0:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+            print(f"Processed {filename}: fixed {fixes_in_file} verses")
+            total_fixes += fixes_in_file
+        else:
+            print(f"Processed {filename}: no fixes needed")
 
-        print(f"Processed {filename}: fixed {fixes_in_file} verses")
-        total_fixes += fixes_in_file
-    else:
-        print(f"Processed {filename}: no fixes needed")
+    print(f"\nAll files processed! Total fixes: {total_fixes}")
 
-print(f"\nAll files processed! Total fixes: {total_fixes}")
+if __name__ == '__main__':
+    main()
@@ -8,35 +8,29 @@ Join multi-line verses in NASB text files so each verse is on a single line.
 import os
 import re
 
-# Path to NASB books directory
-books_dir = os.path.join('..', 'texts', 'nasb', 'books')
-
-# Get all .txt files
-txt_files = [f for f in os.listdir(books_dir) if f.endswith('.txt')]
-
-print(f"Found {len(txt_files)} NASB text files to process")
+from fix_nasb_line_breaks import is_verse_start
 
-for filename in txt_files:
-    filepath = os.path.join(books_dir, filename)
+CHAPTER_HEADER_RE = re.compile(r'^[A-Za-z0-9_ ]+ \d+ New American Standard Bible')
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+# Path to NASB books directory
+books_dir = os.path.join('..', 'texts', 'nasb', 'books')
 
+def join_verse_lines(lines):
+    """Join continuation lines onto their verse; return the joined text."""
     joined_lines = []
 
     for line in lines:
         stripped = line.rstrip('\n')
 
-        # Check if this is a chapter header
-        is_chapter_header = re.match(r'^[A-Za-z0-9_ ]+ \d+ New American Standard Bible', stripped)
-
-        # Check if this is a blank line
-        is_blank = stripped.strip() == ''
-
-        # Check if this is a verse start (begins with a number)
-        is_verse_start = re.match(r'^\d+\s', stripped)
+        # Blank lines, verse starts (begins with a number) and chapter headers
+        # start fresh; the plain string tests run first so the header regex
+        # only sees lines that contain the header text
+        starts_fresh = (stripped.strip() == ''
+                        or is_verse_start(stripped)
+                        or ('New American Standard Bible' in stripped
+                            and CHAPTER_HEADER_RE.match(stripped)))
 
-        if is_chapter_header or is_blank or is_verse_start:
+        if starts_fresh:
             # These lines start fresh
             joined_lines.append(stripped)
         else:
@@ -50,10 +44,35 @@ for filename in txt_files:
                 # Edge case: continuation line with no previous content
                 joined_lines.append(stripped)
 
-    # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(joined_lines))
+    return '\n'.join(joined_lines)
+
+def main():
+    # Get all .txt files
+    with os.scandir(books_dir) as entries:
+        txt_files = [entry for entry in entries if entry.is_file() and entry.name.endswith('.txt')]
+
+    print(f"Found {len(txt_files)} NASB text files to process")
+
+    for entry in txt_files:
+        filename, filepath = entry.name, entry.path
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        joined_content = join_verse_lines(lines)
+
+        # Leave files that were already joined untouched
+        if joined_content == ''.join(lines):
+            print(f"Processed {filename}: no changes needed")
+            continue
+
+        # Write back
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(joined_content)
+
+        print(f"Processed {filename}")
 
-    print(f"Processed {filename}")
+    print("\nAll files processed!")
 
-print("\nAll files processed!")
+if __name__ == '__main__':
+    main()
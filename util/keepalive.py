@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Kept-alive HTTPS GETs for the download scripts.
+
+Each worker thread holds one connection per host and reuses it for every
+request, so a batch of book downloads pays for the TCP and TLS handshakes
+once per thread rather than once per book.
+"""
+
+import http.client
+import threading
+import time
+import urllib.error
+import urllib.parse
+from email.utils import formatdate
+
+# Tries per request, and the pause before the first retry (doubled after each)
+MAX_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+
+# Redirect answers to follow, and how many hops before giving up
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Concurrent requests allowed per host across all threads, to stay polite
+MAX_PER_HOST = 2
+
+_local = threading.local()
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+def _host_limit(host):
+    """Return the semaphore that caps concurrent requests to `host`."""
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.Semaphore(MAX_PER_HOST)
+        return _host_limits[host]
+
+def _connection(scheme, host):
+    """Return this thread's open connection to `host`, creating it if needed."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    if (scheme, host) not in connections:
+        connection_class = http.client.HTTPConnection if scheme == 'http' else http.client.HTTPSConnection
+        connections[scheme, host] = connection_class(host, timeout=60)
+    return connections[scheme, host]
+
+def _get(url, headers):
+    """Send one GET for `url` (with retries) and return (response, body)."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        if attempt:
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        # A kept-alive connection may also have been closed by the server
+        # while idle; dropping it makes the retry open a fresh one
+        conn = _connection(parts.scheme, parts.netloc)
+        try:
+            with _host_limit(parts.netloc):
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del _local.connections[parts.scheme, parts.netloc]
+            if last_attempt:
+                raise
+            continue
+
+        if response.status >= 500 and not last_attempt:
+            continue
+        return response, body
+
+def fetch(url, modified_since=None):
+    """
+    GET an http(s) `url` and return the response body as bytes.
+
+    Redirects are followed (up to MAX_REDIRECTS hops, each on a connection to
+    the hop's own host), as urlopen/urlretrieve do. If `modified_since` (a
+    POSIX timestamp, e.g. a local file's mtime) is given, the request is
+    conditional and None is returned when the server answers 304 Not
+    Modified. Connection failures, timeouts and 5xx answers are retried with
+    exponential backoff before the error is raised.
+    """
+    headers = {}
+    if modified_since is not None:
+        headers['If-Modified-Since'] = formatdate(modified_since, usegmt=True)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        response, body = _get(url, headers)
+        location = response.getheader('Location')
+        if response.status not in REDIRECT_STATUSES or not location:
+            break
+        url = urllib.parse.urljoin(url, location)
+    else:
+        raise urllib.error.HTTPError(url, response.status, 'Too many redirects', response.headers, None)
+
+    if response.status == 304:
+        return None
+    if response.status != 200:
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+    return body
@@ -0,0 +1,77 @@
+"""
+Run the NASB book cleanups in a single pass per file.
+
+Each book file in ./texts/nasb/books/ is read once, put through the same
+transformations the individual scripts apply, and written back once (only if
+it changed), in the order the scripts are run one after another:
+1. Fold continuation lines into their verse (fix_nasb_line_breaks)
+2. Join any remaining continuation lines (join_nasb_verse_lines)
+3. Split lines that hold several verses (split_multi_verse_lines)
+4. Drop blank lines between verses, keeping chapter spacing (clean_nasb_verse_spacing)
+5. Remove the stray space after opening quotes (fix_quote_spacing)
+"""
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from clean_nasb_verse_spacing import clean_spacing
+from fix_nasb_line_breaks import fix_line_breaks
+from fix_quote_spacing import fix_quotes
+from join_nasb_verse_lines import join_verse_lines
+from split_multi_verse_lines import split_verse_lines
+
+def transform(content):
+    """Apply every NASB cleanup to a book's text and return the result."""
+    fixed_lines, _ = fix_line_breaks(io.StringIO(content))
+    content = ''.join(line + '\n' for line in fixed_lines)
+    content = join_verse_lines(io.StringIO(content))
+    content, _ = split_verse_lines(io.StringIO(content))
+    content = clean_spacing(content)
+    content, _ = fix_quotes(content)
+    return content
+
+def process_book(book_file):
+    """Clean one book file in place; return True if it was rewritten."""
+    content = book_file.read_text(encoding='utf-8')
+    processed = transform(content)
+
+    if processed == content:
+        return False
+
+    book_file.write_text(processed, encoding='utf-8')
+    return True
+
+def main():
+    # Get the nasb books directory relative to util/
+    script_dir = Path(__file__).parent
+    nasb_dir = script_dir.parent / 'texts' / 'nasb' / 'books'
+
+    if not nasb_dir.exists():
+        print(f"Error: Directory {nasb_dir} does not exist")
+        return
+
+    book_files = sorted(nasb_dir.glob('*.txt'))
+
+    if not book_files:
+        print(f"No .txt files found in {nasb_dir}")
+        return
+
+    print(f"Found {len(book_files)} book files to process\n")
+
+    # Books are independent, so spread them over a process per core
+    with ProcessPoolExecutor() as executor:
+        changed = list(executor.map(process_book, book_files))
+
+    for book_file, was_changed in zip(book_files, changed):
+        if was_changed:
+            print(f"  Processed {book_file.name}")
+        else:
+            print(f"  No changes needed in {book_file.name}")
+
+    changed_files = changed.count(True)
+
+    print(f"\nCompleted processing {len(book_files)} files ({changed_files} changed)")
+
+if __name__ == '__main__':
+    main()
@@ -13,22 +13,16 @@ The script splits these into separate lines:
 import os
 import re
 
+VERSE_LINE_RE = re.compile(r'^(\d+)\s+(.+)$')
+# An embedded verse number: space or punctuation + digit(s) + quote (single or double).
+# This catches patterns like " 7"", " 10'", ".25""
+EMBEDDED_VERSE_RE = re.compile(r'[.\s](\d+)["\047]')
+
 # Path to NASB books directory
 books_dir = os.path.join('..', 'texts', 'nasb', 'books')
 
-# Get all .txt files
-txt_files = [f for f in os.listdir(books_dir) if f.endswith('.txt')]
-
-print(f"Found {len(txt_files)} NASB text files to process")
-
-total_splits = 0
-
-for filename in txt_files:
-    filepath = os.path.join(books_dir, filename)
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
+def split_verse_lines(lines):
+    """Split lines holding several verses; return (text, number of lines split)."""
     fixed_lines = []
     splits_in_file = 0
 
@@ -36,19 +30,18 @@ for filename in txt_files:
         stripped = line.rstrip('\n')
 
         # Check if this is a verse line (starts with a number)
-        verse_match = re.match(r'^(\d+)\s+(.+)$', stripped)
+        verse_match = VERSE_LINE_RE.match(stripped)
 
         if verse_match:
             verse_num = verse_match.group(1)
             verse_text = verse_match.group(2)
 
-            # Look for additional verse numbers in the text
-            # Pattern: space or punctuation + digit(s) + quote (single or double)
-            # This catches patterns like " 7"", " 10'", ".25""
-            split_pattern = r'[.\s](\d+)["\047]'
-
-            # Find all matches
-            matches = list(re.finditer(split_pattern, verse_text))
+            # Look for additional verse numbers in the text; an embedded number
+            # always ends in a quote, so most verses skip the regex entirely
+            if '"' in verse_text or "'" in verse_text:
+                matches = list(EMBEDDED_VERSE_RE.finditer(verse_text))
+            else:
+                matches = []
 
             if matches:
                 # We have multiple verses on this line
@@ -80,14 +73,36 @@ for filename in txt_files:
             # Not a verse line (chapter header, blank line, etc.)
             fixed_lines.append(stripped)
 
-    if splits_in_file > 0:
-        # Write back to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(fixed_lines))
+    return '\n'.join(fixed_lines), splits_in_file
+
+def main():
+    # Get all .txt files
+    with os.scandir(books_dir) as entries:
+        txt_files = [entry for entry in entries if entry.is_file() and entry.name.endswith('.txt')]
+
+    print(f"Found {len(txt_files)} NASB text files to process")
+
+    total_splits = 0
+
+    for entry in txt_files:
+        filename, filepath = entry.name, entry.path
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        fixed_content, splits_in_file = split_verse_lines(lines)
+
+        if splits_in_file > 0:
+            # Write back to file
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(fixed_content)
+
+            print(f"Processed {filename}: split {splits_in_file} lines")
+            total_splits += splits_in_file
+        else:
+            print(f"Processed {filename}: no splits needed")
 
-        print(f"Processed {filename}: split {splits_in_file} lines")
-        total_splits += splits_in_file
-    else:
-        print(f"Processed {filename}: no splits needed")
+    print(f"\nAll files processed! Total splits: {total_splits}")
 
-print(f"\nAll files processed! Total splits: {total_splits}")
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@
 Split the NASB Bible text file into individual book files.
 """
 
+import mmap
 import re
 import os
 
@@ -18,10 +19,6 @@ def split_nasb_bible(input_file, output_dir):
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    # Read the entire file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     # Complete list of Bible books in order (both Old and New Testament)
     bible_books = [
         'Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy',
@@ -39,24 +36,36 @@ def split_nasb_bible(input_file, output_dir):
         'Jude', 'Revelation'
     ]
 
-    # Create patterns for each book (chapter 1 start)
-    book_patterns = {}
-    for book in bible_books:
-        # Pattern: "BookName 1 New American Standard Bible"
-        pattern = re.compile(rf'^{re.escape(book)} 1 New American Standard Bible', re.MULTILINE)
-        book_patterns[book] = pattern
+    # One pattern for every book's chapter 1 start:
+    # "BookName 1 New American Standard Bible"
+    book_start_pattern = re.compile(
+        rf"^({'|'.join(map(re.escape, bible_books))}) 1 New American Standard Bible".encode('utf-8'),
+        re.MULTILINE)
+
+    # Scan a read-only memory map of the file with the bytes pattern instead of
+    # decoding the whole Bible into one string; each book's bytes go straight out.
+    # An empty file cannot be mapped, so it is read (as no bytes) instead
+    with open(input_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            books_processed = split_mapped_bible(f.read(), book_start_pattern, output_dir)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                books_processed = split_mapped_bible(content, book_start_pattern, output_dir)
 
-    # Find all book starting positions
-    book_positions = []
-    for book in bible_books:
-        matches = list(book_patterns[book].finditer(content))
-        if matches:
-            # Take the first match for each book
-            start_pos = matches[0].start()
-            book_positions.append((start_pos, book))
+    print(f"\nTotal books processed: {books_processed}")
 
-    # Sort by position to maintain order
-    book_positions.sort(key=lambda x: x[0])
+def split_mapped_bible(content, book_start_pattern, output_dir):
+    """Save each book found in the mapped Bible text; return how many were saved."""
+
+    # Find all book starting positions in a single pass over the text; matches
+    # arrive in file order, so only the first one per book needs keeping
+    book_positions = []
+    seen_books = set()
+    for match in book_start_pattern.finditer(content):
+        book = match.group(1).decode('utf-8')
+        if book not in seen_books:
+            seen_books.add(book)
+            book_positions.append((match.start(), book))
 
     # Extract content for each book
     books_processed = 0
@@ -67,37 +76,29 @@ def split_nasb_bible(input_file, output_dir):
         else:
             end_pos = len(content)
 
-        # Extract book content
+        # Extract book content as raw UTF-8 bytes; no decode/re-encode round trip
         book_content = content[start_pos:end_pos].strip()
 
-        if book_content:
-            save_book(book_name, book_content, output_dir)
-            books_processed += 1
-            print(f"Saved {book_name}")
-
-    print(f"\nTotal books processed: {books_processed}")
+        # Skip empty or nearly empty books (under 50 characters) instead of
+        # writing them out; UTF-8 is at most 4 bytes per character, so only
+        # short slices need decoding to tell
+        if len(book_content) < 200 and len(book_content.decode('utf-8')) < 50:
+            print(f"Skipped empty book: {book_name}")
+            continue
 
-    # Clean up any empty files
-    cleanup_empty_files(output_dir)
+        save_book(book_name, book_content, output_dir)
+        books_processed += 1
+        print(f"Saved {book_name}")
 
-def cleanup_empty_files(output_dir):
-    """Remove any empty or nearly empty files."""
-    for filename in os.listdir(output_dir):
-        filepath = os.path.join(output_dir, filename)
-        if os.path.isfile(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            if len(content) < 50:  # Remove files with very little content
-                os.remove(filepath)
-                print(f"Removed empty file: {filename}")
+    return books_processed
 
 def save_book(book_name, content, output_dir):
-    """Save a book's content to a file."""
+    """Save a book's content (UTF-8 bytes, as in the source file) to a file."""
     # Clean up book name for filename (remove spaces, make lowercase, handle numbers)
     filename = book_name.lower().replace(' ', '_') + '.txt'
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
+    with open(filepath, 'wb') as f:
         f.write(content)
 
 def main():